@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-import yaml
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -23,6 +22,7 @@ from .patterndb_yaml import (
     PatterndbYaml,
 )
 from .version_check import SyslogNgVersionError, check_syslog_ng_version
+from .yaml_loading import load_rules_yaml
 
 app = typer.Typer(
     name="patterndb-yaml",
@@ -191,7 +191,7 @@ def main(
     if generate_xml:
         try:
             with open(rules_file) as f:
-                rules_data = yaml.safe_load(f)
+                rules_data = load_rules_yaml(f)
             xml_content = generate_from_yaml(rules_data)
             print(xml_content)
         except typer.Exit:
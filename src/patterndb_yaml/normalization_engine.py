@@ -17,13 +17,15 @@ import re
 import sys
 import tempfile
 from pathlib import Path
-from typing import Optional
-
-import yaml
+from typing import Optional, Union
 
 from .normalization_transforms import get_transform
-from .pattern_filter import PatternMatcher
+from .pattern_filter import PatternMatcher, PatternMatcherPool
 from .pattern_generator import generate_from_yaml
+from .yaml_loading import load_rules_yaml
+
+# Binary ANSI escape codes: ESC[ followed by numbers/semicolons, ending with letter
+BINARY_ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
 
 
 class NormalizationEngine:
@@ -31,25 +33,28 @@ class NormalizationEngine:
     Engine for normalizing lines using pattern-based transformation rules.
     """
 
-    def __init__(self, rules_path: Path, explain: bool = False):
+    def __init__(self, rules_path: Path, explain: bool = False, workers: int = 1):
         """
         Initialize the normalization engine.
 
         Args:
             rules_path: Path to YAML rules file
             explain: If True, output explanations to stderr
+            workers: Number of syslog-ng worker processes for batch matching
+                    (default: 1)
         """
         self.rules_path = rules_path
         self.explain = explain
+        self.workers = workers
         self.current_line_number = 0
 
         # Load rules from YAML
         with open(rules_path) as f:
-            rules_data = yaml.safe_load(f)
-            self.rules = rules_data.get("rules", [])
+            self.rules_data = load_rules_yaml(f)
+            self.rules = self.rules_data.get("rules", [])
 
         # Generate syslog-ng XML patterns from YAML
-        self.xml_content = generate_from_yaml(rules_data)
+        self.xml_content = generate_from_yaml(self.rules_data)
 
         # Write XML to temporary file (cleaned up on exit)
         self.xml_tempfile = tempfile.NamedTemporaryFile(
@@ -62,8 +67,13 @@ class NormalizationEngine:
         # Register cleanup on exit
         atexit.register(self._cleanup)
 
-        # Initialize pattern matcher with generated XML
-        self.pattern_matcher = PatternMatcher(self.xml_path)
+        # Initialize pattern matcher with generated XML; fan out across a
+        # worker pool when more than one worker is requested
+        self.pattern_matcher: Union[PatternMatcher, PatternMatcherPool] = (
+            PatternMatcherPool(self.xml_path, workers)
+            if workers > 1
+            else PatternMatcher(self.xml_path)
+        )
 
         # Build mapping of rule name -> rule for fast lookup
         self.rule_by_name = {rule["name"]: rule for rule in self.rules}
@@ -127,19 +137,57 @@ class NormalizationEngine:
         Returns:
             Normalized line suitable for comparison
         """
-        # Preprocess line for pattern matching
-        import re
+        line_anchored = self._preprocess_line(line)
+
+        # Try to match the line against patterns
+        matched = self.pattern_matcher.match(line_anchored)
+
+        return self._postprocess_match(matched)
+
+    def normalize_batch(self, lines: list[str]) -> list[str]:
+        """
+        Normalize a batch of lines in a single syslog-ng round-trip.
+
+        Preprocesses all lines, sends them through the pattern matcher as one
+        batch, then postprocesses each result. Duplicate lines within the
+        batch are only matched once.
+
+        Args:
+            lines: Input lines to normalize (without trailing newlines)
+
+        Returns:
+            One normalized line per input line, in input order
+        """
+        anchored = [self._preprocess_line(line) for line in lines]
+
+        # Match only unique lines; duplicates reuse the same result
+        unique = list(dict.fromkeys(anchored))
+        matched_by_line = dict(zip(unique, self.pattern_matcher.match_batch(unique)))
 
-        # Binary ANSI escape codes: ESC[ followed by numbers/semicolons, ending with letter
-        BINARY_ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
+        return [self._postprocess_match(matched_by_line[a]) for a in anchored]
 
+    def _preprocess_line(self, line: str) -> str:
+        """
+        Prepare a raw line for pattern matching.
+
+        Strips ANSI codes, escapes non-ASCII and control characters, and adds
+        anchors to force full-line matching.
+
+        Args:
+            line: Raw input line
+
+        Returns:
+            Anchored, escaped line ready for the pattern matcher
+        """
         line_clean = line.rstrip("\r\n")
 
         # Strip binary ANSI codes (formatting only, not semantic)
         # These are escape sequences like \x1b[38;5;174m, \x1b[1m, \x1b[39m
         # They represent visual formatting and should be ignored for pattern matching
         # Original line is always preserved for output
-        line_clean = BINARY_ANSI_PATTERN.sub("", line_clean)
+        # The ESC membership test skips the regex for the common ANSI-free line
+        if "\x1b" in line_clean:
+            line_clean = BINARY_ANSI_PATTERN.sub("", line_clean)
 
         # Convert special characters to Unicode escape format for pattern matching
         # This escapes binary ANSI codes, Unicode, and control characters
@@ -162,11 +210,18 @@ class NormalizationEngine:
 
         # Add anchors to force full-line matching (prevents substring search)
         # This is critical for performance with long lines
-        line_anchored = "^" + line_escaped + "$"
+        return "^" + line_escaped + "$"
 
-        # Try to match the line against patterns
-        matched = self.pattern_matcher.match(line_anchored)
+    def _postprocess_match(self, matched: str) -> str:
+        """
+        Turn a raw pattern-matcher result into the final normalized line.
+
+        Args:
+            matched: Transformed MESSAGE returned by the pattern matcher
 
+        Returns:
+            Normalized line suitable for comparison
+        """
         # Remove anchors from matched output (they were only needed for matching)
         if matched.startswith("^") and matched.endswith("$"):
             matched = matched[1:-1]
@@ -8,17 +8,56 @@ management and pattern matching, without any application-specific logic.
 """
 
 import atexit
+import fcntl
 import os
+import select
+import shutil
 import subprocess
 import sys
 import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
+
+# Buffer size for the blocking reader on the output FIFO
+OUTPUT_BUFFER_SIZE = 65536
+# How long the batch reader waits for output before rechecking the writer (seconds)
+WRITER_POLL_INTERVAL = 0.05
+# Lines accumulated by main() before flushing to stdout
+OUTPUT_FLUSH_LINES = 256
+
+
+# Live matchers keyed by patterndb path, reused by get_or_create so repeat
+# invocations in one process skip the mkdtemp/mkfifo/startup sequence
+_matcher_cache: dict[Path, "PatternMatcher"] = {}
 
 
 class PatternMatcher:
     """Wrapper for persistent syslog-ng process using named pipes."""
 
+    @classmethod
+    def get_or_create(cls, pdb_path: Path) -> "PatternMatcher":
+        """
+        Return a cached matcher for this patterndb path, creating one if needed.
+
+        A cached matcher is reused only while its syslog-ng process is still
+        alive; a dead or closed matcher is replaced transparently.
+
+        Args:
+            pdb_path: Path to patterndb XML file
+
+        Returns:
+            A live PatternMatcher for the given patterndb file
+        """
+        cached = _matcher_cache.get(pdb_path)
+        if cached is not None and cached.process is not None and cached.process.poll() is None:
+            return cached
+
+        matcher = cls(pdb_path)
+        _matcher_cache[pdb_path] = matcher
+        return matcher
+
     def __init__(self, pdb_path: Path):
         """
         Initialize persistent syslog-ng process with FIFOs.
@@ -34,6 +73,10 @@ class PatternMatcher:
         self.config_file: Optional[str] = None
         self.input_fd: int = -1
         self.output_fd: int = -1
+        self._out: Optional[BinaryIO] = None
+        # Single thread pipelining batch writes with result reads; os.write
+        # releases the GIL, so writer and reader genuinely overlap
+        self._writer = ThreadPoolExecutor(max_workers=1)
 
         self._setup()
         atexit.register(self.close)
@@ -106,8 +149,6 @@ log {{
 
         # Wait for syslog-ng to start up and open the FIFOs
         # Poll with short sleeps instead of fixed 0.5s wait
-        import time
-
         max_wait = 0.5  # Maximum time to wait (seconds)
         poll_interval = 0.01  # Check every 10ms
         elapsed = 0.0
@@ -133,6 +174,36 @@ log {{
             # Timeout
             raise RuntimeError(f"Timeout waiting for syslog-ng FIFOs (waited {max_wait}s)")
 
+        # Wait until syslog-ng has opened the output FIFO's write end. A FIFO
+        # with no writer reads EOF even in blocking mode, so without this
+        # handshake the first readline() could return b"" while syslog-ng is
+        # alive and its results are still coming. With O_NONBLOCK still set,
+        # os.read returns b"" while there is no writer and raises
+        # BlockingIOError (no data yet) once one is attached.
+        elapsed = 0.0
+        while elapsed < max_wait:
+            if self.process.poll() is not None:
+                stderr_output = self.process.stderr.read() if self.process.stderr else "No stderr"
+                raise RuntimeError(f"syslog-ng exited during startup: {stderr_output}")
+            try:
+                os.read(self.output_fd, 1)
+            except BlockingIOError:
+                break  # Writer attached; reads now block instead of returning EOF
+            # No writer yet (nothing has been sent, so data cannot appear here)
+            time.sleep(poll_interval)
+            elapsed += poll_interval
+        else:
+            raise RuntimeError(
+                f"Timeout waiting for syslog-ng to open the output FIFO (waited {max_wait}s)"
+            )
+
+        # Both FIFO ends are open now, so switch the output fd to blocking mode
+        # and wrap it in a buffered reader. A blocking readline parks in the
+        # kernel until syslog-ng's flush-lines(1) writes the newline - no
+        # polling, no wasted wakeups.
+        fcntl.fcntl(self.output_fd, fcntl.F_SETFL, 0)
+        self._out = os.fdopen(self.output_fd, "rb", buffering=OUTPUT_BUFFER_SIZE)
+
     def match(self, line: str) -> str:
         """
         Match a line against patterns using persistent syslog-ng process.
@@ -147,35 +218,117 @@ log {{
             # Write line to input FIFO (with newline)
             os.write(self.input_fd, (line + "\n").encode("utf-8"))
 
-            # Read result from output FIFO with retry logic for non-blocking I/O
-            import select
+            # Blocking read until syslog-ng flushes the result line
+            result = self._read_result_line()
+            if not result:
+                # Output FIFO closed (syslog-ng exited) - return original line
+                return line
+            return result.decode("utf-8").rstrip("\n")
 
-            max_retries = 10
-            retry_delay = 0.01  # 10ms
+        except Exception as e:
+            print(f"Error in syslog-ng match: {e}", file=sys.stderr)
+            return line
 
-            for _attempt in range(max_retries):
-                # Check if data is available
-                ready, _, _ = select.select([self.output_fd], [], [], retry_delay)
-                if ready:
-                    # Read up to 64KB (should be plenty for one line)
-                    result = os.read(self.output_fd, 65536).decode("utf-8").rstrip("\n")
-                    if result:
-                        return result
-                # Data not ready yet, try again
+    def match_batch(self, lines: list[str]) -> list[str]:
+        """
+        Match a batch of lines against patterns in a single round-trip.
 
-            # Timeout - no data received, return original line
-            return line
+        The payload write is dispatched to a dedicated writer thread while
+        this thread drains the output FIFO, so writing and reading overlap.
+        Beyond hiding write latency, this prevents a deadlock on large
+        batches: if the whole payload were written before reading, syslog-ng
+        could fill the output FIFO, stop draining the input FIFO, and leave
+        both sides blocked.
+
+        Args:
+            lines: Lines to match (without trailing newlines)
+
+        Returns:
+            One transformed MESSAGE per input line, in input order. Lines
+            for which no output arrived before timeout are returned as-is.
+        """
+        if not lines:
+            return []
+
+        try:
+            payload = bytearray()
+            for line in lines:
+                payload += line.encode("utf-8")
+                payload += b"\n"
+            write_future = self._writer.submit(self._write_payload, payload)
+            results = self._read_batch(lines, write_future)
+            write_future.result()
+            return results
 
         except Exception as e:
-            print(f"Error in syslog-ng match: {e}", file=sys.stderr)
-            return line
+            print(f"Error in syslog-ng batch match: {e}", file=sys.stderr)
+            return list(lines)
+
+    def _write_payload(self, payload: bytearray) -> None:
+        """Write the full payload to the input FIFO, handling partial writes."""
+        # A single writer needs no PIPE_BUF atomicity; os.write moves as much
+        # as the FIFO accepts per call and the loop covers the remainder.
+        view = memoryview(payload)
+        while view:
+            written = os.write(self.input_fd, view)
+            view = view[written:]
+
+    def _read_result_line(self) -> bytes:
+        """
+        Read one result line, only treating empty reads as EOF once syslog-ng exited.
+
+        An empty read means the output FIFO momentarily has no writer,
+        which also happens while syslog-ng is alive (e.g. around config
+        reload). Falling back then would leave the real results to be
+        consumed by the next call, permanently desynchronizing lines and
+        their normalizations, so retry until the process is actually gone.
+
+        Returns:
+            The raw result line, or b"" once the process has exited
+        """
+        assert self._out is not None
+        while True:
+            raw = self._out.readline()
+            if raw:
+                return raw
+            if self.process is None or self.process.poll() is not None:
+                return b""
+            time.sleep(WRITER_POLL_INTERVAL)
+
+    def _read_batch(self, lines: list[str], write_future: "Future[None]") -> list[str]:
+        """Collect one newline-terminated result per input line from the output FIFO."""
+        results: list[str] = []
+
+        for _ in lines:
+            # Never park in readline() while the writer could still fail:
+            # wait for output readiness in short slices until the write
+            # resolves, then surface a writer error instead of blocking on
+            # results that will never arrive.
+            while not write_future.done():
+                ready, _, _ = select.select([self.output_fd], [], [], WRITER_POLL_INTERVAL)
+                if ready:
+                    break
+            else:
+                write_future.result()
+            raw = self._read_result_line()
+            if not raw:
+                # Output FIFO closed (syslog-ng exited) - fall back to originals
+                results.extend(lines[len(results) :])
+                break
+            results.append(raw.decode("utf-8").rstrip("\n"))
+
+        return results
 
     def close(self) -> None:
         """Close the syslog-ng process and clean up FIFOs."""
+        self._writer.shutdown(wait=False)
         try:
             if self.input_fd >= 0:
                 os.close(self.input_fd)
-            if self.output_fd >= 0:
+            if self._out is not None:
+                # Closing the buffered reader also closes the underlying fd
+                self._out.close()
+            elif self.output_fd >= 0:
                 os.close(self.output_fd)
         except Exception:
             pass
@@ -189,11 +342,82 @@ log {{
 
         # Clean up temp directory
         if self.temp_dir and os.path.exists(self.temp_dir):
-            import shutil
-
             shutil.rmtree(self.temp_dir, ignore_errors=True)
 
 
+class PatternMatcherPool:
+    """
+    Fan pattern matching out across multiple persistent syslog-ng processes.
+
+    A single syslog-ng process is the throughput ceiling for large batches.
+    The pool owns one PatternMatcher per worker and splits each batch into
+    per-worker chunks dispatched on a thread pool; os.write/read release the
+    GIL, so workers genuinely run in parallel. Output order is preserved by
+    concatenating chunk results in dispatch order.
+
+    The pool mirrors PatternMatcher's public interface (match, match_batch,
+    close) so callers can use either interchangeably.
+    """
+
+    def __init__(self, pdb_path: Path, n_workers: Optional[int] = None):
+        """
+        Initialize the pool of syslog-ng workers.
+
+        Args:
+            pdb_path: Path to patterndb XML file
+            n_workers: Number of syslog-ng worker processes
+                      (default: os.cpu_count())
+        """
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.matchers = [PatternMatcher(pdb_path) for _ in range(self.n_workers)]
+        self._executor = ThreadPoolExecutor(max_workers=self.n_workers)
+        atexit.register(self.close)
+
+    def match(self, line: str) -> str:
+        """
+        Match a single line against patterns.
+
+        Args:
+            line: Line to match
+
+        Returns:
+            Transformed MESSAGE from syslog-ng, or original line if no match
+        """
+        return self.matchers[0].match(line)
+
+    def match_batch(self, lines: list[str]) -> list[str]:
+        """
+        Match a batch of lines, fanning chunks out across the workers.
+
+        Args:
+            lines: Lines to match (without trailing newlines)
+
+        Returns:
+            One transformed MESSAGE per input line, in input order
+        """
+        if len(lines) < self.n_workers * 2:
+            # Not worth the dispatch overhead for tiny batches
+            return self.matchers[0].match_batch(lines)
+
+        chunk_size = -(-len(lines) // self.n_workers)  # Ceiling division
+        chunks = [lines[i : i + chunk_size] for i in range(0, len(lines), chunk_size)]
+        futures = [
+            self._executor.submit(matcher.match_batch, chunk)
+            for matcher, chunk in zip(self.matchers, chunks)
+        ]
+
+        results: list[str] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def close(self) -> None:
+        """Shut down the thread pool and all syslog-ng workers."""
+        self._executor.shutdown(wait=False)
+        for matcher in self.matchers:
+            matcher.close()
+
+
 def main() -> None:
     """Main entry point for pattern matching filter"""
     # Get the patterns.xml path relative to this module
@@ -204,25 +428,50 @@ def main() -> None:
         print(f"Error: patterns.xml not found at {pdb_path}", file=sys.stderr)
         sys.exit(1)
 
-    # Initialize pattern matcher
-    matcher = PatternMatcher(pdb_path)
+    # Initialize pattern matcher (reused across invocations in this process)
+    matcher = PatternMatcher.get_or_create(pdb_path)
+
+    # Accumulate output and flush every OUTPUT_FLUSH_LINES lines instead of
+    # one print (stdout lock + possible write syscall) per line
+    write = sys.stdout.write
+    buf: list[str] = []
+    pending = 0
 
     try:
         # Process stdin line by line
         for line in sys.stdin:
             line = line.rstrip("\n")
-            result = matcher.match(line)
+            buf.append(matcher.match(line))
+            buf.append("\n")
+            pending += 1
+            if pending >= OUTPUT_FLUSH_LINES:
+                try:
+                    write("".join(buf))
+                    sys.stdout.flush()
+                except BrokenPipeError:
+                    # Output pipe closed (e.g., piped to head), exit gracefully
+                    sys.stderr.close()
+                    break
+                buf.clear()
+                pending = 0
+        else:
+            # Input drained - flush whatever is left
             try:
-                print(result)
+                write("".join(buf))
+                sys.stdout.flush()
             except BrokenPipeError:
-                # Output pipe closed (e.g., piped to head), exit gracefully
                 sys.stderr.close()
-                break
+            buf.clear()
     except KeyboardInterrupt:
-        # Handle Ctrl+C gracefully
-        pass
-    finally:
-        matcher.close()
+        # Ctrl+C - emit the already-matched lines still in the buffer so at
+        # most the in-flight line is lost, as with the unbuffered loop
+        try:
+            write("".join(buf))
+            sys.stdout.flush()
+        except BrokenPipeError:
+            sys.stderr.close()
+    # The cached matcher is deliberately left running so later invocations
+    # in this process reuse it; the atexit hook from __init__ closes it.
 
 
 if __name__ == "__main__":
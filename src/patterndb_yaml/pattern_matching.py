@@ -6,12 +6,48 @@ and other pattern-matching components.
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
 # Compile ANSI escape sequence regex once at module import time
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
 
 
+@lru_cache(maxsize=1)
+def _strip_ansi_sub(line: str) -> str:
+    """Apply the ANSI regex substitution, caching the most recent result."""
+    return ANSI_RE.sub("", line)
+
+
+def strip_ansi_cached(line: str) -> str:
+    """
+    Strip ANSI escape codes from a line, caching the most recent result.
+
+    Lines without an ESC byte (the overwhelmingly common case) are
+    returned unchanged after a single C-level membership test, skipping
+    both the regex and the cache. A line is checked against every
+    follower pattern of the active sequence back to back, so a
+    single-entry cache avoids re-stripping the same line once per
+    pattern.
+
+    Args:
+        line: Line to strip
+
+    Returns:
+        Line with ANSI escape codes removed
+    """
+    if "\x1b" not in line:
+        return line
+    return _strip_ansi_sub(line)
+
+
+# Compile NUMBER field parser regex once at module import time
+NUMBER_RE = re.compile(r"\d+")
+
+# Key under which rendered alternative texts are memoized on the component dict
+RENDERED_ALTERNATIVES_KEY = "_rendered_alternatives"
+
+
 def match_pattern_components(
     line: str, pattern_components: list[dict[str, Any]], extract_fields: bool = False
 ) -> tuple[bool, dict[str, str]]:
@@ -28,8 +64,8 @@ def match_pattern_components(
     Returns:
         Tuple of (matched: bool, fields: dict)
     """
-    # Strip ANSI codes from line (use precompiled ANSI_RE)
-    line_clean = ANSI_RE.sub("", line)
+    # Strip ANSI codes from line (cached across consecutive calls on the same line)
+    line_clean = strip_ansi_cached(line)
 
     pos = 0  # Current position in line_clean
     fields = {}  # Extracted field values
@@ -39,12 +75,17 @@ def match_pattern_components(
             return False, {}  # Ran past end of line
 
         if "alternatives" in component:
-            # Try to match any alternative at current position
+            # Try to match any alternative at current position.
+            # Rendered texts are memoized on the component dict so each
+            # alternative is only rendered once, not once per line.
+            rendered = component.get(RENDERED_ALTERNATIVES_KEY)
+            if rendered is None:
+                rendered = [render_component_sequence(alt) for alt in component["alternatives"]]
+                component[RENDERED_ALTERNATIVES_KEY] = rendered
+
             matched = False
-            for alt in component["alternatives"]:
-                # Each alternative is a list of elements
-                alt_text = render_component_sequence(alt)
-                if line_clean[pos:].startswith(alt_text):
+            for alt_text in rendered:
+                if line_clean.startswith(alt_text, pos):
                     pos += len(alt_text)
                     matched = True
                     break
@@ -58,13 +99,13 @@ def match_pattern_components(
             parser = component.get("parser")
 
             if parser == "NUMBER":
-                # Match digits
-                match = re.match(r"\d+", line_clean[pos:])
+                # Match digits at the current position (no slice copy)
+                match = NUMBER_RE.match(line_clean, pos)
                 if not match:
                     return False, {}
                 if extract_fields:
                     fields[field_name] = match.group()
-                pos += len(match.group())
+                pos = match.end()
             else:
                 # Extract until end of line (ANYSTRING behavior)
                 # Note: ESTRING delimiter inference is handled in pattern_generator.py
@@ -75,14 +116,14 @@ def match_pattern_components(
         elif "text" in component:
             # Fixed text must match exactly
             text = component["text"]
-            if not line_clean[pos:].startswith(text):
+            if not line_clean.startswith(text, pos):
                 return False, {}
             pos += len(text)
 
         elif "serialized" in component:
             # Serialized characters must match exactly
             serialized_str = component["serialized"]
-            if not line_clean[pos:].startswith(serialized_str):
+            if not line_clean.startswith(serialized_str, pos):
                 return False, {}
             pos += len(serialized_str)
 
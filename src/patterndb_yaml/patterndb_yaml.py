@@ -1,42 +1,143 @@
 """Core logic for processor."""
 
 import sys
-from functools import lru_cache
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any, BinaryIO, Callable, Optional, TextIO, Union
-
-import yaml
+from typing import Any, BinaryIO, Callable, NamedTuple, Optional, TextIO, Union, cast
 
 from .normalization_engine import NormalizationEngine
 from .sequence_processor import SequenceProcessor
+from .yaml_loading import load_rules_yaml
+
+# Number of input lines batched into one syslog-ng round-trip in process()
+PROCESS_BATCH_SIZE = 1024
+
+# Bytes/characters read from the input stream per chunk in process()
+READ_CHUNK_SIZE = 65536
+
+# Entries held in the normalize memo before it is bulk-evicted
+NORMALIZE_CACHE_SIZE = 65536
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics compatible with functools.lru_cache's cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _NormalizeCache:
+    """
+    Sized memo for normalized lines with bulk eviction.
+
+    A plain dict beats functools.lru_cache here: misses dominate on
+    mostly-unique streams, and lru_cache pays for linked-list bookkeeping
+    and double hashing on every call. Clearing wholesale once the dict
+    reaches its size bound is amortized O(1) with comparable hit rates on
+    streaming data.
+    """
+
+    def __init__(self, normalize: Callable[[str], str], maxsize: int = NORMALIZE_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            normalize: Callable computing the normalized form of a line
+            maxsize: Number of entries held before the cache is bulk-evicted
+        """
+        self._normalize = normalize
+        self._maxsize = maxsize
+        self._cache: dict[str, str] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, line: str) -> str:
+        """Return the normalized form of a line, memoizing the result."""
+        cached = self._cache.get(line)
+        if cached is not None:
+            self._hits += 1
+            return cached
+        self._misses += 1
+        result = self._normalize(line)
+        self._insert(line, result)
+        return result
+
+    def normalize_batch(
+        self, lines: list[str], normalize_batch: Callable[[list[str]], list[str]]
+    ) -> list[str]:
+        """
+        Normalize a batch of lines, sending only cache misses to the matcher.
+
+        Duplicates within the batch count as hits: they avoid a syslog-ng
+        round-trip just like previously cached lines do.
+
+        Args:
+            lines: Input lines to normalize
+            normalize_batch: Callable normalizing the missed lines as a batch
 
+        Returns:
+            One normalized line per input line, in input order
+        """
+        resolved: dict[str, str] = {}
+        misses: list[str] = []
+        for line in lines:
+            if line in resolved:
+                self._hits += 1
+            else:
+                cached = self._cache.get(line)
+                if cached is not None:
+                    self._hits += 1
+                    resolved[line] = cached
+                else:
+                    self._misses += 1
+                    resolved[line] = ""  # Placeholder so batch duplicates count as hits
+                    misses.append(line)
+
+        if misses:
+            for line, result in zip(misses, normalize_batch(misses)):
+                resolved[line] = result
+                self._insert(line, result)
 
-def _load_sequence_config(rules_path: Path) -> tuple[dict[str, Any], set[str]]:
+        return [resolved[line] for line in lines]
+
+    def _insert(self, line: str, result: str) -> None:
+        """Store a result, bulk-evicting once the size bound is reached."""
+        if len(self._cache) >= self._maxsize:
+            self._cache.clear()
+        self._cache[line] = result
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss statistics in lru_cache's cache_info() shape."""
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))
+
+
+def _load_sequence_config(
+    rules_data: dict[str, Any],
+) -> tuple[dict[str, Any], set[str], dict[str, str]]:
     """
-    Load multi-line sequence configuration from normalization rules YAML.
+    Extract multi-line sequence configuration from parsed rules data.
 
     Finds rules with a 'sequence' field - these are leader patterns that
     start multi-line sequences.
 
     Args:
-        rules_path: Path to normalization_rules.yaml
+        rules_data: Parsed normalization rules (as loaded from YAML)
 
     Returns:
-        Tuple of (sequence_configs dict, sequence_markers set)
+        Tuple of (sequence_configs dict, sequence_markers set, marker_to_rule dict)
         - sequence_configs: Dictionary mapping rule names to their sequence configurations
         - sequence_markers: Set of normalized output prefixes that identify sequence leaders
                            (extracted from the 'output' field, e.g., "[dialog-question:")
+        - marker_to_rule: Mapping from each marker back to its rule name, so
+                          leader detection resolves the rule with one dict get
     """
-    if not rules_path.exists():
-        return {}, set()
-
-    with open(rules_path) as f:
-        data = yaml.safe_load(f)
-
     sequences = {}
     markers = set()
+    marker_to_rule: dict[str, str] = {}
 
-    for rule in data.get("rules", []):
+    for rule in rules_data.get("rules", []):
         if "sequence" in rule:
             rule_name = rule["name"]
             sequences[rule_name] = rule
@@ -47,28 +148,53 @@ def _load_sequence_config(rules_path: Path) -> tuple[dict[str, Any], set[str]]:
                 # before first field placeholder
                 # e.g., "[dialog-question:{content}]" -> "[dialog-question:"
                 marker = output[: output.index("{")]
-                markers.add(marker)
             else:
                 # No field placeholder in the output
                 # e.g., "[my-output]"
-                markers.add(output)
+                marker = output
+            markers.add(marker)
+            marker_to_rule[marker] = rule_name
+
+    return sequences, markers, marker_to_rule
+
+
+def _load_sequence_config_from_path(
+    rules_path: Path,
+) -> tuple[dict[str, Any], set[str], dict[str, str]]:
+    """
+    Load multi-line sequence configuration from a rules YAML file.
+
+    Thin wrapper around _load_sequence_config for callers that do not
+    already hold the parsed rules data.
+
+    Args:
+        rules_path: Path to normalization_rules.yaml
+
+    Returns:
+        Same tuple as _load_sequence_config
+    """
+    if not rules_path.exists():
+        return {}, set(), {}
 
-    return sequences, markers
+    with open(rules_path) as f:
+        return _load_sequence_config(load_rules_yaml(f))
 
 
 def _initialize_engine(
     rules_path: Path,
     explain: bool = False,
-) -> tuple[NormalizationEngine, dict[str, Any], set[str]]:
+    workers: int = 1,
+) -> tuple[NormalizationEngine, dict[str, Any], set[str], dict[str, str]]:
     """
     Initialize normalization engine and load sequence configurations.
 
     Args:
         rules_path: Path to normalization_rules.yaml
         explain: If True, enable explain mode in the engine
+        workers: Number of syslog-ng worker processes for batch matching
 
     Returns:
-        Tuple of (norm_engine, sequence_configs, sequence_markers)
+        Tuple of (norm_engine, sequence_configs, sequence_markers, marker_to_rule)
 
     Raises:
         FileNotFoundError: If rules file does not exist
@@ -78,20 +204,21 @@ def _initialize_engine(
         raise FileNotFoundError(f"Rules file not found: {rules_path}")
 
     try:
-        norm_engine = NormalizationEngine(rules_path, explain=explain)
+        norm_engine = NormalizationEngine(rules_path, explain=explain, workers=workers)
 
-        # Provide a cached normalize callable to reduce repeated work on identical lines
-        @lru_cache(maxsize=65536)
-        def _normalize_cached(s: str) -> str:
-            return norm_engine.normalize(s)
-
-        # Attach for downstream use
-        norm_engine.normalize_cached = _normalize_cached  # type: ignore[attr-defined]
+        # Provide a cached normalize callable to reduce repeated work on
+        # identical lines; attach for downstream use
+        norm_engine.normalize_cached = _NormalizeCache(  # type: ignore[attr-defined]
+            norm_engine.normalize
+        )
 
-        # Load sequence configurations
-        sequence_configs, sequence_markers = _load_sequence_config(rules_path)
+        # Load sequence configurations from the engine's already-parsed
+        # rules data instead of re-reading and re-parsing the YAML file
+        sequence_configs, sequence_markers, marker_to_rule = _load_sequence_config(
+            norm_engine.rules_data
+        )
 
-        return norm_engine, sequence_configs, sequence_markers
+        return norm_engine, sequence_configs, sequence_markers, marker_to_rule
 
     except Exception as e:
         raise RuntimeError(f"Failed to initialize normalization engine: {e}") from e
@@ -109,6 +236,7 @@ class PatterndbYaml:
         self,
         rules_path: Path,
         explain: bool = False,
+        workers: int = 1,
     ):
         """
         Initialize processor.
@@ -117,18 +245,21 @@ class PatterndbYaml:
             rules_path: Path to normalization rules YAML file
             explain: If True, output explanations to stderr showing why lines were normalized
                     (default: False)
+            workers: Number of syslog-ng worker processes for batch matching
+                    (default: 1)
         """
         self.rules_path = rules_path
         self.explain = explain  # Show explanations to stderr
 
         # Initialize normalization engine and sequence processor (raises on failure)
-        self.norm_engine, sequence_configs, sequence_markers = _initialize_engine(
-            rules_path, explain=explain
+        self.norm_engine, sequence_configs, sequence_markers, marker_to_rule = _initialize_engine(
+            rules_path, explain=explain, workers=workers
         )
         # Pass explain callback to SequenceProcessor
         self.seq_processor = SequenceProcessor(
             sequence_configs,
             sequence_markers,
+            marker_to_rule=marker_to_rule,
             explain_callback=self._print_explain if explain else None,
         )
 
@@ -229,16 +360,120 @@ class PatterndbYaml:
             output: Output stream to write to
             progress_callback: Optional callback for progress updates
         """
-        # Process lines through normalization engine
-        for line in stream:
-            line = line.rstrip("\n") if isinstance(line, str) else line.decode("utf-8").rstrip("\n")
-            self.lines_processed += 1
+        # Read input in large chunks and split lines in C via str.split
+        # instead of paying the per-line iterator and allocation overhead of
+        # `for line in stream`. The text/binary branch is taken once on the
+        # first chunk, not per line. Explain mode stays on the per-line path
+        # so explanations keep their line-by-line ordering.
+        batch: list[str] = []
+
+        first = stream.read(READ_CHUNK_SIZE)
+        if isinstance(first, bytes):
+            chunks = self._iter_binary_lines(first, cast(BinaryIO, stream))
+        else:
+            chunks = self._iter_text_lines(first, cast(TextIO, stream))
+
+        for lines in chunks:
+            if self.explain:
+                for line in lines:
+                    self._process_one(line, output, progress_callback)
+            else:
+                batch.extend(lines)
+                while len(batch) >= PROCESS_BATCH_SIZE:
+                    self._process_batch(batch[:PROCESS_BATCH_SIZE], output, progress_callback)
+                    batch = batch[PROCESS_BATCH_SIZE:]
 
-            # Update line number in normalization engine for explain output
-            self.norm_engine.current_line_number = self.lines_processed
+        if batch:
+            self._process_batch(batch, output, progress_callback)
 
-            # Normalize the line
-            normalized = self.norm_engine.normalize_cached(line)  # type: ignore[attr-defined]
+        # Flush any remaining buffered sequence at end of input
+        self.seq_processor.flush_sequence(output)
+
+    @staticmethod
+    def _iter_text_lines(first: str, stream: TextIO) -> Iterator[list[str]]:
+        """
+        Yield lists of complete lines from a text stream, one list per chunk.
+
+        Args:
+            first: First chunk already read from the stream
+            stream: Text stream to continue reading from
+
+        Yields:
+            Complete lines (without newlines) for each chunk read
+        """
+        tail = ""
+        chunk = first
+        while chunk:
+            parts = (tail + chunk).split("\n")
+            tail = parts.pop()
+            yield parts
+            chunk = stream.read(READ_CHUNK_SIZE)
+        if tail:
+            # Final line when input is not newline-terminated
+            yield [tail]
+
+    @staticmethod
+    def _iter_binary_lines(first: bytes, stream: BinaryIO) -> Iterator[list[str]]:
+        """
+        Yield lists of complete lines from a binary stream, one list per chunk.
+
+        Splits on the newline byte before decoding: a chunk boundary may fall
+        inside a multi-byte UTF-8 sequence, but never inside a newline.
+
+        Args:
+            first: First chunk already read from the stream
+            stream: Binary stream to continue reading from
+
+        Yields:
+            Decoded complete lines (without newlines) for each chunk read
+        """
+        tail = b""
+        chunk = first
+        while chunk:
+            parts = (tail + chunk).split(b"\n")
+            tail = parts.pop()
+            yield [part.decode("utf-8") for part in parts]
+            chunk = stream.read(READ_CHUNK_SIZE)
+        if tail:
+            # Final line when input is not newline-terminated
+            yield [tail.decode("utf-8")]
+
+    def _process_one(
+        self,
+        line: str,
+        output: Union[TextIO, BinaryIO],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """Normalize and emit a single line (per-line path used in explain mode)."""
+        self.lines_processed += 1
+
+        # Update line number in normalization engine for explain output
+        self.norm_engine.current_line_number = self.lines_processed
+
+        # Normalize the line
+        normalized = self.norm_engine.normalize_cached(line)  # type: ignore[attr-defined]
+        if not normalized.startswith("^"):
+            self.lines_matched += 1
+
+        # Process the line (handles sequence buffering)
+        self.seq_processor.process_line(line, normalized, output)
+
+        if progress_callback:
+            progress_callback(self.lines_processed, self.lines_processed - self.lines_matched)
+
+    def _process_batch(
+        self,
+        batch: list[str],
+        output: Union[TextIO, BinaryIO],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """Normalize a chunk of lines in one syslog-ng round-trip and emit them."""
+        normalized_batch = self.norm_engine.normalize_cached.normalize_batch(  # type: ignore[attr-defined]
+            batch, self.norm_engine.normalize_batch
+        )
+
+        for line, normalized in zip(batch, normalized_batch):
+            self.lines_processed += 1
             if not normalized.startswith("^"):
                 self.lines_matched += 1
 
@@ -248,9 +483,6 @@ class PatterndbYaml:
             if progress_callback:
                 progress_callback(self.lines_processed, self.lines_processed - self.lines_matched)
 
-        # Flush any remaining buffered sequence at end of input
-        self.seq_processor.flush_sequence(output)
-
     def flush(self, output: Union[TextIO, BinaryIO]) -> None:
         """
         Flush any buffered output.
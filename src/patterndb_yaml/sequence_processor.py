@@ -5,6 +5,7 @@ where a leader line is followed by multiple follower lines that should be
 grouped and output together.
 """
 
+import re
 from typing import Any, BinaryIO, Callable, Optional, TextIO, Union, cast
 
 from .pattern_matching import match_pattern_components
@@ -17,6 +18,7 @@ class SequenceProcessor:
         self,
         sequence_configs: dict[str, Any],
         sequence_markers: set[str],
+        marker_to_rule: Optional[dict[str, str]] = None,
         explain_callback: Optional[Callable[[str], None]] = None,
     ) -> None:
         """
@@ -25,10 +27,39 @@ class SequenceProcessor:
         Args:
             sequence_configs: Dictionary of sequence rule configurations
             sequence_markers: Set of output markers that identify sequence leaders
+            marker_to_rule: Mapping from each marker to its rule name; derived
+                           from the configs when not provided
             explain_callback: Optional callback for explanation messages
         """
         self.sequence_configs = sequence_configs
         self.sequence_markers = sequence_markers
+        # Marker -> rule name resolved once here, so leader detection is a
+        # dict get instead of scanning every rule's output per matched line
+        self._marker_to_rule: dict[str, str] = (
+            marker_to_rule
+            if marker_to_rule is not None
+            else {
+                marker: rule_name
+                for marker in sequence_markers
+                for rule_name, rule in sequence_configs.items()
+                if marker in str(rule.get("output", ""))
+            }
+        )
+        # Single start-anchored alternation over all markers, so leader
+        # detection is one C-level match instead of a per-marker startswith
+        # scan. Longest-first ordering keeps overlapping markers deterministic.
+        self._marker_re: Optional[re.Pattern[str]] = (
+            re.compile(
+                "|".join(re.escape(m) for m in sorted(sequence_markers, key=len, reverse=True))
+            )
+            if sequence_markers
+            else None
+        )
+        if not sequence_markers:
+            # No sequence rules configured: every line is a regular line, so
+            # swap in a write-only process_line and skip leader/follower
+            # checks entirely on this common path
+            self.process_line = self._process_line_no_sequences  # type: ignore[method-assign]
         self.current_sequence: Optional[str] = None  # Current sequence rule being buffered
         self.sequence_buffer: list[
             tuple[str, str]
@@ -45,21 +76,26 @@ class SequenceProcessor:
         if self.sequence_buffer:
             count = len(self.sequence_buffer)
             self._explain(f"Flushed sequence '{self.current_sequence}' ({count} lines buffered)")
-            for _, norm_line in self.sequence_buffer:
-                cast(TextIO, output).write(norm_line + "\n")
+            # Coalesce the whole buffered sequence into a single write call;
+            # one join pass instead of a per-line "+ newline" temporary
+            cast(TextIO, output).write(
+                "\n".join(norm_line for _, norm_line in self.sequence_buffer) + "\n"
+            )
         self.sequence_buffer = []
         self.current_sequence = None
 
     def is_sequence_leader(self, normalized: str) -> Optional[str]:
         """Check if normalized line starts a sequence. Returns rule name if yes."""
-        for marker in self.sequence_markers:
-            if normalized.startswith(marker):
-                # Extract rule name from marker (e.g., "[dialog-question:" -> "dialog_question")
-                for rule_name in self.sequence_configs:
-                    rule_output = str(self.sequence_configs[rule_name].get("output", ""))
-                    if marker in rule_output:
-                        return rule_name
-        return None
+        if self._marker_re is None:
+            return None
+
+        match = self._marker_re.match(normalized)
+        if not match:
+            return None
+
+        # Resolve the matched marker to its rule name (e.g.,
+        # "[dialog-question:" -> "dialog_question") with a single dict get
+        return self._marker_to_rule.get(match.group())
 
     def is_sequence_follower(self, raw_line: str, rule_name: str) -> bool:
         """Check if raw line matches any follower pattern for the given sequence."""
@@ -122,6 +158,22 @@ class SequenceProcessor:
         # No pattern matched
         return raw_line
 
+    def _process_line_no_sequences(
+        self, raw_line: str, normalized: str, output: Union[TextIO, BinaryIO]
+    ) -> None:
+        """
+        Output a line directly (fast path when no sequences are configured).
+
+        Installed as process_line at init when there are no sequence markers,
+        reducing the per-line work to a single write.
+
+        Args:
+            raw_line: Raw input line (unused; kept for signature parity)
+            normalized: Normalized version of the line
+            output: Output stream to write to
+        """
+        cast(TextIO, output).write(normalized + "\n")
+
     def process_line(self, raw_line: str, normalized: str, output: Union[TextIO, BinaryIO]) -> None:
         """
         Process and output a line (handling sequences).
@@ -8,6 +8,40 @@ from unittest.mock import patch
 import pytest
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip needs_syslogng tests when the syslog-ng binary is unavailable.
+
+    Skipped items are never set up or torn down, so their fixtures and
+    subprocess spawn attempts are avoided entirely on unsuited hosts.
+    """
+    if shutil.which("syslog-ng"):
+        return
+    skip = pytest.mark.skip(reason="syslog-ng not installed")
+    for item in items:
+        if "needs_syslogng" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def syslogng_path():
+    """Path to the syslog-ng binary, or None when it is not installed."""
+    return shutil.which("syslog-ng")
+
+
+@pytest.fixture(scope="session")
+def empty_processor(tmp_path_factory):
+    """Read-only PatterndbYaml built once per session from an empty ruleset.
+
+    Shared across every test on the worker; must not be mutated. Tests
+    that change processor state should build their own from tmp_path.
+    """
+    from patterndb_yaml.patterndb_yaml import PatterndbYaml
+
+    rules_file = tmp_path_factory.mktemp("empty-rules") / "rules.yaml"
+    rules_file.write_text("rules: []")
+    return PatterndbYaml(rules_file)
+
+
 @pytest.fixture
 def temp_dir():
     """Temporary directory for test files."""
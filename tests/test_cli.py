@@ -49,6 +49,7 @@ def test_cli_help():
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 def test_cli_with_file(rules_file, tmp_path):
     """Test CLI with input file."""
     # Create test file
@@ -61,6 +62,7 @@ def test_cli_with_file(rules_file, tmp_path):
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 def test_cli_with_stdin(rules_file):
     """Test CLI with stdin input."""
     input_data = "\n".join([f"line{i % 3}" for i in range(30)])
@@ -71,6 +73,7 @@ def test_cli_with_stdin(rules_file):
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 def test_cli_empty_stdin(rules_file):
     """Test CLI with empty stdin input"""
     result = runner.invoke(app, ["--rules", str(rules_file), "--quiet"], input="")
@@ -79,6 +82,7 @@ def test_cli_empty_stdin(rules_file):
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 def test_cli_empty_file(rules_file, tmp_path):
     """Test CLI with empty file input."""
     test_file = tmp_path / "empty.txt"
@@ -92,6 +96,7 @@ def test_cli_empty_file(rules_file, tmp_path):
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 def test_cli_statistics_output(rules_file, tmp_path):
     """Test CLI statistics are shown (not quiet mode)."""
     test_file = tmp_path / "test.txt"
@@ -104,6 +109,7 @@ def test_cli_statistics_output(rules_file, tmp_path):
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 def test_cli_quiet_mode(rules_file, tmp_path):
     """Test CLI quiet mode suppresses statistics."""
     test_file = tmp_path / "test.txt"
@@ -122,6 +128,7 @@ def test_cli_nonexistent_file():
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 def test_cli_progress_flag(rules_file, tmp_path):
     """Test CLI with --progress flag."""
     test_file = tmp_path / "test.txt"
@@ -134,6 +141,7 @@ def test_cli_progress_flag(rules_file, tmp_path):
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 def test_cli_progress_with_stdin(rules_file):
     """Test progress bar with stdin input (covers cli.py lines 493-502)."""
     input_data = "\n".join([f"line{i % 10}" for i in range(1000)])
@@ -144,6 +152,7 @@ def test_cli_progress_with_stdin(rules_file):
 
 
 @pytest.mark.integration
+@pytest.mark.needs_syslogng
 def test_cli_empty_file_integration(rules_file, tmp_path):
     """Test CLI with empty input file (integration test)."""
     test_file = tmp_path / "empty.txt"
@@ -155,6 +164,7 @@ def test_cli_empty_file_integration(rules_file, tmp_path):
 
 
 @pytest.mark.integration
+@pytest.mark.needs_syslogng
 def test_cli_single_line(rules_file, tmp_path):
     """Test CLI with single line input."""
     test_file = tmp_path / "single.txt"
@@ -167,6 +177,7 @@ def test_cli_single_line(rules_file, tmp_path):
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 def test_cli_json_stats_format(rules_file, tmp_path):
     """Test --stats-format json produces valid JSON."""
     import json
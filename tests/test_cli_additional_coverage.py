@@ -85,6 +85,7 @@ def test_generate_xml_with_invalid_rules():
 
 
 @pytest.mark.integration
+@pytest.mark.needs_syslogng
 def test_processing_with_file_input():
     """Test normal processing with file input (covered path)."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -118,6 +119,7 @@ def test_processing_with_file_input():
 
 
 @pytest.mark.integration
+@pytest.mark.needs_syslogng
 def test_stdin_with_stats():
     """Test stdin input with statistics display."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -147,6 +149,7 @@ def test_stdin_with_stats():
 
 
 @pytest.mark.integration
+@pytest.mark.needs_syslogng
 def test_stats_json_format():
     """Test JSON statistics format."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -182,6 +185,7 @@ def test_stats_json_format():
 
 
 @pytest.mark.integration
+@pytest.mark.needs_syslogng
 def test_progress_disabled_when_piping():
     """Test that progress is automatically disabled when output is piped."""
     with tempfile.TemporaryDirectory() as tmpdir:
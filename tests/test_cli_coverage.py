@@ -12,6 +12,9 @@ from typing import Optional
 import pytest
 from typer.testing import CliRunner, Result
 
+pytestmark = pytest.mark.needs_syslogng
+
+
 # Ensure consistent terminal width
 os.environ.setdefault("COLUMNS", "120")
 
@@ -8,6 +8,7 @@ import pytest
 from typer.testing import CliRunner
 
 from patterndb_yaml.cli import app
+from patterndb_yaml.version_check import SyslogNgVersionError
 
 runner = CliRunner()
 
@@ -83,6 +84,7 @@ class TestCLIExceptionHandling:
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestCLIInputValidation:
     """Tests for CLI input validation."""
 
@@ -102,6 +104,7 @@ class TestCLIInputValidation:
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestCLIProgressMode:
     """Tests for progress bar functionality."""
 
@@ -163,6 +166,7 @@ class TestCLIProgressMode:
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestCLIStatsOutput:
     """Tests for statistics output modes."""
 
@@ -213,6 +217,7 @@ class TestCLIStatsOutput:
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestCLIEdgeCases:
     """Tests for CLI edge cases."""
 
@@ -290,6 +295,7 @@ rules:
 class TestCLIValidateArguments:
     """Tests for argument validation."""
 
+    @pytest.mark.needs_syslogng
     def test_validate_stats_format(self):
         """Test that stats format is validated."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -339,6 +345,7 @@ class TestCLIValidateArguments:
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestCLIInteractiveMode:
     """Tests for interactive mode detection."""
 
@@ -372,8 +379,6 @@ class TestCLIVersionCheckErrors:
 
     def test_version_check_error_handling(self):
         """Test that version check errors are handled properly."""
-        from patterndb_yaml.version_check import SyslogNgVersionError
-
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
             rules_file = tmpdir / "rules.yaml"
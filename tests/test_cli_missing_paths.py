@@ -13,6 +13,7 @@ runner = CliRunner()
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestCLIInteractiveMode:
     """Tests for interactive mode (no input, TTY)."""
 
@@ -33,6 +34,7 @@ class TestCLIInteractiveMode:
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestCLIProgressBar:
     """Tests for progress bar functionality."""
 
@@ -125,6 +127,7 @@ class TestCLIKeyboardInterrupt:
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestCLIStatsFormatting:
     """Tests for statistics output formatting."""
 
@@ -277,6 +280,7 @@ class TestCLIValidateArguments:
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestCLIProcessWithoutProgress:
     """Tests for processing without progress bar."""
 
@@ -1,33 +1,40 @@
 """Tests for CLI statistics printing."""
 
+import io
+
 import pytest
+from rich.console import Console
 
 from patterndb_yaml.cli import print_stats
-from patterndb_yaml.patterndb_yaml import PatterndbYaml
 
+pytestmark = pytest.mark.needs_syslogng
+
+# Narrow width short-circuits rich's per-glyph wrap calculations
+QUIET_CONSOLE_WIDTH = 20
 
-@pytest.mark.unit
-def test_print_stats_normal(tmp_path):
-    """Test print_stats with normal processor."""
-    # Create rules file
-    rules_file = tmp_path / "rules.yaml"
-    rules_file.write_text("rules: []")
 
-    processor = PatterndbYaml(rules_file)
+@pytest.fixture
+def quiet_console(monkeypatch):
+    """Swap the CLI console for a minimal in-memory one.
 
-    # print_stats writes to stderr via rich Console
-    # Just verify it doesn't crash
-    print_stats(processor)
+    Rendering to a StringIO at a fixed narrow width keeps rich from
+    measuring real terminal geometry and from writing to stderr.
+    """
+    buf = io.StringIO()
+    quiet = Console(
+        file=buf,
+        width=QUIET_CONSOLE_WIDTH,
+        force_terminal=False,
+        no_color=True,
+        emoji=False,
+        markup=False,
+    )
+    monkeypatch.setattr("patterndb_yaml.cli.console", quiet)
+    return buf
 
 
 @pytest.mark.unit
-def test_print_stats_empty(tmp_path):
+def test_print_stats_does_not_crash(empty_processor, quiet_console):
     """Test print_stats with no lines processed."""
-    # Create rules file
-    rules_file = tmp_path / "rules.yaml"
-    rules_file.write_text("rules: []")
-
-    processor = PatterndbYaml(rules_file)
-
-    # print_stats should handle empty stats
-    print_stats(processor)
+    print_stats(empty_processor)
+    assert quiet_console.getvalue()
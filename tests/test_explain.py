@@ -10,6 +10,8 @@ import pytest
 
 from patterndb_yaml.patterndb_yaml import PatterndbYaml
 
+pytestmark = pytest.mark.needs_syslogng
+
 
 @pytest.mark.unit
 class TestExplainBasic:
@@ -1,5 +1,6 @@
 """Tests for __init__.py module."""
 
+import importlib.util
 import sys
 from unittest.mock import patch
 
@@ -34,6 +35,16 @@ def test_init_all_exports():
     assert "__version__" in __all__
 
 
+@pytest.mark.unit
+def test_pattern_filter_importable_without_syslogng():
+    """Test that pattern_filter is resolvable without syslog-ng installed.
+
+    find_spec resolves the module without executing its body, so this
+    holds regardless of whether the syslog-ng binary is present.
+    """
+    assert importlib.util.find_spec("patterndb_yaml.pattern_filter") is not None
+
+
 @pytest.mark.unit
 def test_version_import_fallback():
     """Test version import fallback when _version module is not available."""
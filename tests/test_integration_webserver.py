@@ -1,8 +1,6 @@
 """Integration tests for web server log normalization with realistic synthetic data."""
 
-import tempfile
 from io import StringIO
-from pathlib import Path
 
 import pytest
 import yaml
@@ -10,8 +8,15 @@ import yaml
 from patterndb_yaml import PatterndbYaml
 
 
+@pytest.fixture(autouse=True)
+def _require_syslogng(syslogng_path):
+    """Skip these integration tests when syslog-ng is not installed."""
+    if syslogng_path is None:
+        pytest.skip("syslog-ng not installed")
+
+
 @pytest.fixture
-def webserver_rules():
+def webserver_rules(tmp_path):
     """Rules for normalizing mixed nginx and apache logs."""
     rules = {
         "rules": [
@@ -83,9 +88,9 @@ def webserver_rules():
         ]
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(rules, f)
-        return Path(f.name)
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text(yaml.dump(rules))
+    return rules_path
 
 
 @pytest.fixture
@@ -14,6 +14,7 @@ def test_main_module_import():
 
 
 @pytest.mark.integration
+@pytest.mark.needs_syslogng
 def test_main_module_execution(tmp_path):
     """Test running patterndb-yaml as a module with python -m."""
     # Create rules file
@@ -1,16 +1,15 @@
 """Tests for normalization_engine module."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 import yaml
 
 from patterndb_yaml.normalization_engine import NormalizationEngine
 
+pytestmark = pytest.mark.needs_syslogng
+
 
 @pytest.fixture
-def simple_rules_file():
+def simple_rules_file(tmp_path):
     """Create a simple rules file for testing."""
     rules = {
         "rules": [
@@ -21,13 +20,13 @@ def simple_rules_file():
             }
         ]
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(rules, f)
-        return Path(f.name)
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text(yaml.dump(rules))
+    return rules_path
 
 
 @pytest.fixture
-def transform_rules_file():
+def transform_rules_file(tmp_path):
     """Create rules file with field transforms."""
     rules = {
         "rules": [
@@ -41,9 +40,9 @@ def transform_rules_file():
             }
         ]
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(rules, f)
-        return Path(f.name)
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text(yaml.dump(rules))
+    return rules_path
 
 
 @pytest.mark.unit
@@ -164,7 +163,7 @@ class TestNormalizeEdgeCases:
 
         engine.close()
 
-    def test_normalize_template_missing_field(self, simple_rules_file):
+    def test_normalize_template_missing_field(self, simple_rules_file, tmp_path):
         """Test normalize when output template references missing field."""
         # Create rules with template that references a field not in pattern
         rules = {
@@ -176,29 +175,25 @@ class TestNormalizeEdgeCases:
                 }
             ]
         }
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_file = Path(f.name)
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(yaml.dump(rules))
 
-        try:
-            engine = NormalizationEngine(rules_file)
+        engine = NormalizationEngine(rules_file)
 
-            # Simulate a match with only field1
-            encoded = "[bad_template]|field1=value1|"
-            parsed = engine._parse_encoded_message(encoded)
-            assert parsed is not None
+        # Simulate a match with only field1
+        encoded = "[bad_template]|field1=value1|"
+        parsed = engine._parse_encoded_message(encoded)
+        assert parsed is not None
 
-            rule_name, fields = parsed
-            rule = engine.rule_by_name[rule_name]
-            output_template = str(rule.get("output", ""))
+        rule_name, fields = parsed
+        rule = engine.rule_by_name[rule_name]
+        output_template = str(rule.get("output", ""))
 
-            # Template formatting should fail due to missing_field
-            with pytest.raises(KeyError):
-                output_template.format(**fields)
+        # Template formatting should fail due to missing_field
+        with pytest.raises(KeyError):
+            output_template.format(**fields)
 
-            engine.close()
-        finally:
-            rules_file.unlink()
+        engine.close()
 
 
 @pytest.mark.unit
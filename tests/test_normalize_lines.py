@@ -1,34 +1,29 @@
 """Tests for normalize_lines method - batch normalization with sequence support."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 import yaml
 
 from patterndb_yaml import PatterndbYaml
 
+pytestmark = pytest.mark.needs_syslogng
+
 
 @pytest.mark.unit
 class TestNormalizeLinesBasic:
     """Basic normalization tests without sequences."""
 
-    def test_normalize_empty_list(self):
+    def test_normalize_empty_list(self, tmp_path):
         """Test normalizing an empty list."""
         rules = {"rules": []}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            result = processor.normalize_lines([])
-            assert result == []
-        finally:
-            rules_path.unlink()
+        processor = PatterndbYaml(rules_path=rules_path)
+        result = processor.normalize_lines([])
+        assert result == []
 
-    def test_normalize_single_line(self):
+    def test_normalize_single_line(self, tmp_path):
         """Test normalizing a single line."""
         rules = {
             "rules": [
@@ -40,18 +35,14 @@ class TestNormalizeLinesBasic:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            result = processor.normalize_lines(["test"])
-            assert result == ["[TEST]"]
-        finally:
-            rules_path.unlink()
+        processor = PatterndbYaml(rules_path=rules_path)
+        result = processor.normalize_lines(["test"])
+        assert result == ["[TEST]"]
 
-    def test_normalize_multiple_lines(self):
+    def test_normalize_multiple_lines(self, tmp_path):
         """Test normalizing multiple lines without sequences."""
         rules = {
             "rules": [
@@ -68,27 +59,23 @@ class TestNormalizeLinesBasic:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
-
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            lines = [
-                "ERROR: Something failed",
-                "WARN: Low memory",
-                "ERROR: Connection lost",
-            ]
-            result = processor.normalize_lines(lines)
-            assert result == [
-                "[ERROR:Something failed]",
-                "[WARN:Low memory]",
-                "[ERROR:Connection lost]",
-            ]
-        finally:
-            rules_path.unlink()
-
-    def test_normalize_unmatched_lines(self):
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
+
+        processor = PatterndbYaml(rules_path=rules_path)
+        lines = [
+            "ERROR: Something failed",
+            "WARN: Low memory",
+            "ERROR: Connection lost",
+        ]
+        result = processor.normalize_lines(lines)
+        assert result == [
+            "[ERROR:Something failed]",
+            "[WARN:Low memory]",
+            "[ERROR:Connection lost]",
+        ]
+
+    def test_normalize_unmatched_lines(self, tmp_path):
         """Test normalizing lines that don't match any pattern."""
         rules = {
             "rules": [
@@ -100,32 +87,28 @@ class TestNormalizeLinesBasic:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            lines = [
-                "ERROR: Matched line",
-                "INFO: Unmatched line",
-                "DEBUG: Another unmatched",
-            ]
-            result = processor.normalize_lines(lines)
+        processor = PatterndbYaml(rules_path=rules_path)
+        lines = [
+            "ERROR: Matched line",
+            "INFO: Unmatched line",
+            "DEBUG: Another unmatched",
+        ]
+        result = processor.normalize_lines(lines)
 
-            # Matched line should be normalized, unmatched lines pass through
-            assert result[0] == "[ERROR:Matched line]"
-            assert result[1] == "INFO: Unmatched line"
-            assert result[2] == "DEBUG: Another unmatched"
-        finally:
-            rules_path.unlink()
+        # Matched line should be normalized, unmatched lines pass through
+        assert result[0] == "[ERROR:Matched line]"
+        assert result[1] == "INFO: Unmatched line"
+        assert result[2] == "DEBUG: Another unmatched"
 
 
 @pytest.mark.integration
 class TestNormalizeLinesSequences:
     """Tests for sequence processing in normalize_lines."""
 
-    def test_simple_sequence(self):
+    def test_simple_sequence(self, tmp_path):
         """Test a simple sequence with leader and follower."""
         rules = {
             "rules": [
@@ -151,24 +134,20 @@ class TestNormalizeLinesSequences:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            lines = [
-                "Q: What is 2+2?",
-                "A: 4",
-            ]
-            result = processor.normalize_lines(lines)
+        processor = PatterndbYaml(rules_path=rules_path)
+        lines = [
+            "Q: What is 2+2?",
+            "A: 4",
+        ]
+        result = processor.normalize_lines(lines)
 
-            # Both leader and follower should be in result
-            assert result == ["[Q:What is 2+2?]", "[A:4]"]
-        finally:
-            rules_path.unlink()
+        # Both leader and follower should be in result
+        assert result == ["[Q:What is 2+2?]", "[A:4]"]
 
-    def test_sequence_with_multiple_followers(self):
+    def test_sequence_with_multiple_followers(self, tmp_path):
         """Test sequence with multiple follower lines."""
         rules = {
             "rules": [
@@ -194,25 +173,21 @@ class TestNormalizeLinesSequences:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            lines = [
-                "Q: What is 2+2?",
-                "A: 4",
-                "A: Or maybe 5?",
-            ]
-            result = processor.normalize_lines(lines)
+        processor = PatterndbYaml(rules_path=rules_path)
+        lines = [
+            "Q: What is 2+2?",
+            "A: 4",
+            "A: Or maybe 5?",
+        ]
+        result = processor.normalize_lines(lines)
 
-            # Leader and both followers should be in result
-            assert result == ["[Q:What is 2+2?]", "[A:4]", "[A:Or maybe 5?]"]
-        finally:
-            rules_path.unlink()
+        # Leader and both followers should be in result
+        assert result == ["[Q:What is 2+2?]", "[A:4]", "[A:Or maybe 5?]"]
 
-    def test_sequence_interrupted_by_non_follower(self):
+    def test_sequence_interrupted_by_non_follower(self, tmp_path):
         """Test sequence interrupted by a non-follower line."""
         rules = {
             "rules": [
@@ -243,32 +218,28 @@ class TestNormalizeLinesSequences:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
-
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            lines = [
-                "Q: What is 2+2?",
-                "A: 4",
-                "INFO: Some info",  # This interrupts the sequence
-                "A: This won't be part of the sequence",
-            ]
-            result = processor.normalize_lines(lines)
-
-            # First Q+A sequence should be complete
-            # INFO should break the sequence
-            # Last A won't match as a follower since sequence was broken
-            assert "[Q:What is 2+2?]" in result
-            assert "[A:4]" in result
-            assert "[INFO:Some info]" in result
-            # Last line won't match any pattern, so passes through unchanged
-            assert result[3] == "A: This won't be part of the sequence"
-        finally:
-            rules_path.unlink()
-
-    def test_multiple_sequences(self):
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
+
+        processor = PatterndbYaml(rules_path=rules_path)
+        lines = [
+            "Q: What is 2+2?",
+            "A: 4",
+            "INFO: Some info",  # This interrupts the sequence
+            "A: This won't be part of the sequence",
+        ]
+        result = processor.normalize_lines(lines)
+
+        # First Q+A sequence should be complete
+        # INFO should break the sequence
+        # Last A won't match as a follower since sequence was broken
+        assert "[Q:What is 2+2?]" in result
+        assert "[A:4]" in result
+        assert "[INFO:Some info]" in result
+        # Last line won't match any pattern, so passes through unchanged
+        assert result[3] == "A: This won't be part of the sequence"
+
+    def test_multiple_sequences(self, tmp_path):
         """Test multiple sequences in one batch."""
         rules = {
             "rules": [
@@ -294,31 +265,27 @@ class TestNormalizeLinesSequences:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
-
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            lines = [
-                "Q: First question?",
-                "A: First answer",
-                "Q: Second question?",
-                "A: Second answer",
-            ]
-            result = processor.normalize_lines(lines)
-
-            # Both sequences should be complete
-            assert result == [
-                "[Q:First question?]",
-                "[A:First answer]",
-                "[Q:Second question?]",
-                "[A:Second answer]",
-            ]
-        finally:
-            rules_path.unlink()
-
-    def test_sequence_at_end_gets_flushed(self):
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
+
+        processor = PatterndbYaml(rules_path=rules_path)
+        lines = [
+            "Q: First question?",
+            "A: First answer",
+            "Q: Second question?",
+            "A: Second answer",
+        ]
+        result = processor.normalize_lines(lines)
+
+        # Both sequences should be complete
+        assert result == [
+            "[Q:First question?]",
+            "[A:First answer]",
+            "[Q:Second question?]",
+            "[A:Second answer]",
+        ]
+
+    def test_sequence_at_end_gets_flushed(self, tmp_path):
         """Test that a sequence at the end of input is properly flushed."""
         rules = {
             "rules": [
@@ -338,29 +305,25 @@ class TestNormalizeLinesSequences:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
-
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            lines = [
-                "START: Process beginning",
-                "  First detail",
-                "  Second detail",
-            ]
-            result = processor.normalize_lines(lines)
-
-            # All lines should be in result (sequence flushed at end)
-            assert result == [
-                "[START:Process beginning]",
-                "[DETAIL:First detail]",
-                "[DETAIL:Second detail]",
-            ]
-        finally:
-            rules_path.unlink()
-
-    def test_sequence_only_leader_no_followers(self):
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
+
+        processor = PatterndbYaml(rules_path=rules_path)
+        lines = [
+            "START: Process beginning",
+            "  First detail",
+            "  Second detail",
+        ]
+        result = processor.normalize_lines(lines)
+
+        # All lines should be in result (sequence flushed at end)
+        assert result == [
+            "[START:Process beginning]",
+            "[DETAIL:First detail]",
+            "[DETAIL:Second detail]",
+        ]
+
+    def test_sequence_only_leader_no_followers(self, tmp_path):
         """Test sequence with only leader line, no followers."""
         rules = {
             "rules": [
@@ -386,26 +349,22 @@ class TestNormalizeLinesSequences:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            lines = ["Q: Unanswered question?"]
-            result = processor.normalize_lines(lines)
+        processor = PatterndbYaml(rules_path=rules_path)
+        lines = ["Q: Unanswered question?"]
+        result = processor.normalize_lines(lines)
 
-            # Leader should be flushed at end even without followers
-            assert result == ["[Q:Unanswered question?]"]
-        finally:
-            rules_path.unlink()
+        # Leader should be flushed at end even without followers
+        assert result == ["[Q:Unanswered question?]"]
 
 
 @pytest.mark.integration
 class TestNormalizeLinesEdgeCases:
     """Edge case tests for normalize_lines."""
 
-    def test_normalize_lines_preserves_state_isolation(self):
+    def test_normalize_lines_preserves_state_isolation(self, tmp_path):
         """Test that multiple calls to normalize_lines don't interfere."""
         rules = {
             "rules": [
@@ -431,24 +390,20 @@ class TestNormalizeLinesEdgeCases:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
+        processor = PatterndbYaml(rules_path=rules_path)
 
-            # First batch
-            result1 = processor.normalize_lines(["Q: First?", "A: First answer"])
-            assert result1 == ["[Q:First?]", "[A:First answer]"]
+        # First batch
+        result1 = processor.normalize_lines(["Q: First?", "A: First answer"])
+        assert result1 == ["[Q:First?]", "[A:First answer]"]
 
-            # Second batch should not be affected by first
-            result2 = processor.normalize_lines(["Q: Second?", "A: Second answer"])
-            assert result2 == ["[Q:Second?]", "[A:Second answer]"]
-        finally:
-            rules_path.unlink()
+        # Second batch should not be affected by first
+        result2 = processor.normalize_lines(["Q: Second?", "A: Second answer"])
+        assert result2 == ["[Q:Second?]", "[A:Second answer]"]
 
-    def test_normalize_lines_with_mixed_content(self):
+    def test_normalize_lines_with_mixed_content(self, tmp_path):
         """Test normalize_lines with sequences and non-sequences mixed."""
         rules = {
             "rules": [
@@ -479,30 +434,26 @@ class TestNormalizeLinesEdgeCases:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
-
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            lines = [
-                "LOG: Starting",
-                "Q: What's up?",
-                "A: Not much",
-                "LOG: Done",
-            ]
-            result = processor.normalize_lines(lines)
-
-            assert result == [
-                "[LOG:Starting]",
-                "[Q:What's up?]",
-                "[A:Not much]",
-                "[LOG:Done]",
-            ]
-        finally:
-            rules_path.unlink()
-
-    def test_normalize_lines_performance_optimization(self):
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
+
+        processor = PatterndbYaml(rules_path=rules_path)
+        lines = [
+            "LOG: Starting",
+            "Q: What's up?",
+            "A: Not much",
+            "LOG: Done",
+        ]
+        result = processor.normalize_lines(lines)
+
+        assert result == [
+            "[LOG:Starting]",
+            "[Q:What's up?]",
+            "[A:Not much]",
+            "[LOG:Done]",
+        ]
+
+    def test_normalize_lines_performance_optimization(self, tmp_path):
         """Test that normalize_lines handles large batches efficiently."""
         rules = {
             "rules": [
@@ -514,21 +465,17 @@ class TestNormalizeLinesEdgeCases:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
+        processor = PatterndbYaml(rules_path=rules_path)
 
-            # Create a large batch of lines
-            lines = [f"LOG {i}" for i in range(1000)]
+        # Create a large batch of lines
+        lines = [f"LOG {i}" for i in range(1000)]
 
-            result = processor.normalize_lines(lines)
+        result = processor.normalize_lines(lines)
 
-            # Verify all lines were normalized
-            assert len(result) == 1000
-            assert result[0] == "[LOG:0]"
-            assert result[999] == "[LOG:999]"
-        finally:
-            rules_path.unlink()
+        # Verify all lines were normalized
+        assert len(result) == 1000
+        assert result[0] == "[LOG:0]"
+        assert result[999] == "[LOG:999]"
@@ -1,45 +1,58 @@
 """Comprehensive tests for pattern_filter module using mocks."""
 
 import subprocess
-import tempfile
 from io import StringIO
-from pathlib import Path
 from unittest.mock import Mock, patch
+from xml.etree import ElementTree as ET
 
 import pytest
 
-from patterndb_yaml.pattern_filter import PatternMatcher, main
+from patterndb_yaml import pattern_filter
+from patterndb_yaml.pattern_filter import PatternMatcher, PatternMatcherPool, main
 
 
-@pytest.fixture
-def mock_pdb_file():
-    """Create a temporary patterndb file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
-        f.write(
-            """<?xml version="1.0"?>
-            <patterndb version="6" pub_date="2025-01-01">
-              <ruleset name="test" id="test">
-                <pattern>test</pattern>
-                <rules>
-                  <rule provider="test" id="test" class="test">
-                    <patterns>
-                      <pattern>test</pattern>
-                    </patterns>
-                  </rule>
-                </rules>
-              </ruleset>
-            </patterndb>"""
-        )
-        pdb_path = Path(f.name)
-    yield pdb_path
-    pdb_path.unlink()
+def _minify_xml(raw: bytes) -> bytes:
+    """Validate fixture XML at import time and strip indentation."""
+    root = ET.fromstring(raw)
+    for elem in root.iter():
+        if elem.text is not None and not elem.text.strip():
+            elem.text = None
+        if elem.tail is not None and not elem.tail.strip():
+            elem.tail = None
+    return ET.tostring(root, encoding="utf-8")
+
+
+PDB_XML = _minify_xml(b"""<?xml version="1.0"?>
+<patterndb version="6" pub_date="2025-01-01">
+  <ruleset name="test" id="test">
+    <pattern>test</pattern>
+    <rules>
+      <rule provider="test" id="test" class="test">
+        <patterns>
+          <pattern>test</pattern>
+        </patterns>
+      </rule>
+    </rules>
+  </ruleset>
+</patterndb>""")
+
+
+@pytest.fixture(scope="session")
+def mock_pdb_file(tmp_path_factory):
+    """Patterndb XML file written once for the whole session."""
+    pdb_path = tmp_path_factory.mktemp("pdb") / "test.xml"
+    pdb_path.write_bytes(PDB_XML)
+    return pdb_path
 
 
 @pytest.mark.unit
 class TestPatternMatcherInit:
     """Tests for PatternMatcher initialization."""
 
+    @patch("os.read", side_effect=BlockingIOError)
     @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
     @patch("atexit.register")
     @patch("time.sleep")
     @patch("os.open")
@@ -54,7 +67,10 @@ class TestPatternMatcherInit:
         mock_os_open,
         mock_sleep,
         mock_atexit,
+        mock_fcntl,
+        mock_fdopen,
         mock_file_open,
+        mock_os_read,
         mock_pdb_file,
     ):
         """Test successful PatternMatcher initialization."""
@@ -78,6 +94,10 @@ class TestPatternMatcherInit:
         # Verify FIFOs were created
         assert mock_mkfifo.call_count == 2
 
+        # Verify the output fd was switched to blocking and wrapped
+        mock_fcntl.assert_called_once()
+        mock_fdopen.assert_called_once_with(100, "rb", buffering=65536)
+
         # Verify syslog-ng was started
         mock_popen.assert_called_once()
 
@@ -85,6 +105,84 @@ class TestPatternMatcherInit:
         with patch("os.close"), patch("shutil.rmtree"):
             matcher.close()
 
+    @patch("os.read")
+    @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
+    @patch("atexit.register")
+    @patch("time.sleep")
+    @patch("os.open")
+    @patch("subprocess.Popen")
+    @patch("os.mkfifo")
+    @patch("tempfile.mkdtemp")
+    def test_waits_for_output_writer(
+        self,
+        mock_mkdtemp,
+        mock_mkfifo,
+        mock_popen,
+        mock_os_open,
+        mock_sleep,
+        mock_atexit,
+        mock_fcntl,
+        mock_fdopen,
+        mock_file_open,
+        mock_os_read,
+        mock_pdb_file,
+    ):
+        """Test setup retries until syslog-ng opens the output FIFO's write end."""
+        mock_mkdtemp.return_value = "/tmp/test-dir"
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+        mock_popen.return_value = mock_process
+        mock_os_open.side_effect = [100, 101]
+        # EOF (no writer) twice, then BlockingIOError (writer attached)
+        mock_os_read.side_effect = [b"", b"", BlockingIOError()]
+
+        matcher = PatternMatcher(mock_pdb_file)
+
+        assert mock_os_read.call_count == 3
+        # Only after the handshake is the fd switched to blocking mode
+        mock_fcntl.assert_called_once()
+
+        with patch("os.close"), patch("shutil.rmtree"):
+            matcher.close()
+
+    @patch("os.read", return_value=b"")
+    @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
+    @patch("atexit.register")
+    @patch("time.sleep")
+    @patch("os.open")
+    @patch("subprocess.Popen")
+    @patch("os.mkfifo")
+    @patch("tempfile.mkdtemp")
+    def test_exit_during_output_writer_wait(
+        self,
+        mock_mkdtemp,
+        mock_mkfifo,
+        mock_popen,
+        mock_os_open,
+        mock_sleep,
+        mock_atexit,
+        mock_fcntl,
+        mock_fdopen,
+        mock_file_open,
+        mock_os_read,
+        mock_pdb_file,
+    ):
+        """Test setup raises if syslog-ng dies before opening the output FIFO."""
+        mock_mkdtemp.return_value = "/tmp/test-dir"
+        mock_process = Mock()
+        # Alive through the open loop, exited when the writer wait rechecks
+        mock_process.poll.side_effect = [None, None, 1]
+        mock_process.stderr = StringIO("startup failure")
+        mock_popen.return_value = mock_process
+        mock_os_open.side_effect = [100, 101]
+
+        with pytest.raises(RuntimeError, match="exited during startup"):
+            PatternMatcher(mock_pdb_file)
+
     @patch("builtins.open", create=True)
     @patch("atexit.register")
     @patch("time.sleep")
@@ -152,9 +250,10 @@ class TestPatternMatcherInit:
 class TestPatternMatcherMatch:
     """Tests for PatternMatcher.match method."""
 
+    @patch("os.read", side_effect=BlockingIOError)
     @patch("builtins.open", create=True)
-    @patch("select.select")
-    @patch("os.read")
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
     @patch("os.write")
     @patch("atexit.register")
     @patch("time.sleep")
@@ -171,9 +270,10 @@ class TestPatternMatcherMatch:
         mock_sleep,
         mock_atexit,
         mock_os_write,
-        mock_os_read,
-        mock_select,
+        mock_fcntl,
+        mock_fdopen,
         mock_file_open,
+        mock_os_read,
         mock_pdb_file,
     ):
         """Test successful line matching."""
@@ -184,28 +284,31 @@ class TestPatternMatcherMatch:
         mock_popen.return_value = mock_process
         mock_os_open.side_effect = [100, 101]  # output_fd, input_fd
 
+        mock_out = Mock()
+        mock_fdopen.return_value = mock_out
+
         matcher = PatternMatcher(mock_pdb_file)
 
-        # Setup mocks for match
-        mock_select.return_value = ([100], [], [])  # Data ready on first try
-        mock_os_read.return_value = b"normalized output\n"
+        # Setup mock for the blocking readline
+        mock_out.readline.return_value = b"normalized output\n"
 
         result = matcher.match("test input line")
 
         # Verify line was written to input
         mock_os_write.assert_called_once_with(101, b"test input line\n")
 
-        # Verify output was read
-        mock_os_read.assert_called_once_with(100, 65536)
+        # Verify output was read with a single blocking readline
+        mock_out.readline.assert_called_once_with()
 
         assert result == "normalized output"
 
         with patch("os.close"), patch("shutil.rmtree"):
             matcher.close()
 
+    @patch("os.read", side_effect=BlockingIOError)
     @patch("builtins.open", create=True)
-    @patch("select.select")
-    @patch("os.read")
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
     @patch("os.write")
     @patch("atexit.register")
     @patch("time.sleep")
@@ -213,7 +316,7 @@ class TestPatternMatcherMatch:
     @patch("subprocess.Popen")
     @patch("os.mkfifo")
     @patch("tempfile.mkdtemp")
-    def test_match_timeout(
+    def test_match_output_closed(
         self,
         mock_mkdtemp,
         mock_mkfifo,
@@ -222,12 +325,13 @@ class TestPatternMatcherMatch:
         mock_sleep,
         mock_atexit,
         mock_os_write,
-        mock_os_read,
-        mock_select,
+        mock_fcntl,
+        mock_fdopen,
         mock_file_open,
+        mock_os_read,
         mock_pdb_file,
     ):
-        """Test match timeout (no data received after max retries)."""
+        """Test match returns original line when the output FIFO is closed."""
         # Setup mocks for initialization
         mock_mkdtemp.return_value = "/tmp/test-dir"
         mock_process = Mock()
@@ -235,21 +339,77 @@ class TestPatternMatcherMatch:
         mock_popen.return_value = mock_process
         mock_os_open.side_effect = [100, 101]
 
+        mock_out = Mock()
+        mock_fdopen.return_value = mock_out
+
         matcher = PatternMatcher(mock_pdb_file)
 
-        # Simulate data never becoming ready
-        mock_select.return_value = ([], [], [])
+        # Simulate EOF (syslog-ng exited and closed the write end)
+        mock_out.readline.return_value = b""
+        mock_process.poll.return_value = 1
 
         result = matcher.match("test input")
 
-        # Should return original line on timeout
+        # Should return original line on EOF
         assert result == "test input"
-        assert mock_select.call_count == 10  # max_retries
 
         with patch("os.close"), patch("shutil.rmtree"):
             matcher.close()
 
+    @patch("os.read", side_effect=BlockingIOError)
     @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
+    @patch("os.write")
+    @patch("atexit.register")
+    @patch("time.sleep")
+    @patch("os.open")
+    @patch("subprocess.Popen")
+    @patch("os.mkfifo")
+    @patch("tempfile.mkdtemp")
+    def test_match_retries_transient_empty_read(
+        self,
+        mock_mkdtemp,
+        mock_mkfifo,
+        mock_popen,
+        mock_os_open,
+        mock_sleep,
+        mock_atexit,
+        mock_os_write,
+        mock_fcntl,
+        mock_fdopen,
+        mock_file_open,
+        mock_os_read,
+        mock_pdb_file,
+    ):
+        """Test an empty read while syslog-ng is alive is retried, not EOF."""
+        mock_mkdtemp.return_value = "/tmp/test-dir"
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+        mock_popen.return_value = mock_process
+        mock_os_open.side_effect = [100, 101]
+
+        mock_out = Mock()
+        mock_fdopen.return_value = mock_out
+
+        matcher = PatternMatcher(mock_pdb_file)
+
+        # Empty read with the process still alive, then the real result
+        mock_out.readline.side_effect = [b"", b"normalized output\n"]
+
+        result = matcher.match("test input")
+
+        # The transient empty read must not surface as a fallback
+        assert result == "normalized output"
+        assert mock_out.readline.call_count == 2
+
+        with patch("os.close"), patch("shutil.rmtree"):
+            matcher.close()
+
+    @patch("os.read", side_effect=BlockingIOError)
+    @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
     @patch("os.write")
     @patch("atexit.register")
     @patch("time.sleep")
@@ -266,7 +426,10 @@ class TestPatternMatcherMatch:
         mock_sleep,
         mock_atexit,
         mock_os_write,
+        mock_fcntl,
+        mock_fdopen,
         mock_file_open,
+        mock_os_read,
         mock_pdb_file,
     ):
         """Test match handles exceptions gracefully."""
@@ -277,6 +440,8 @@ class TestPatternMatcherMatch:
         mock_popen.return_value = mock_process
         mock_os_open.side_effect = [100, 101]
 
+        mock_fdopen.return_value = Mock()
+
         matcher = PatternMatcher(mock_pdb_file)
 
         # Simulate write error
@@ -291,11 +456,222 @@ class TestPatternMatcherMatch:
             matcher.close()
 
 
+@pytest.mark.unit
+class TestPatternMatcherMatchBatch:
+    """Tests for PatternMatcher.match_batch method."""
+
+    @patch("os.read", side_effect=BlockingIOError)
+    @patch("select.select")
+    @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
+    @patch("os.write")
+    @patch("atexit.register")
+    @patch("time.sleep")
+    @patch("os.open")
+    @patch("subprocess.Popen")
+    @patch("os.mkfifo")
+    @patch("tempfile.mkdtemp")
+    def test_successful_batch_match(
+        self,
+        mock_mkdtemp,
+        mock_mkfifo,
+        mock_popen,
+        mock_os_open,
+        mock_sleep,
+        mock_atexit,
+        mock_os_write,
+        mock_fcntl,
+        mock_fdopen,
+        mock_file_open,
+        mock_select,
+        mock_os_read,
+        mock_pdb_file,
+    ):
+        """Test matching a batch of lines in one round-trip."""
+        # Setup mocks for initialization
+        mock_mkdtemp.return_value = "/tmp/test-dir"
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+        mock_popen.return_value = mock_process
+        mock_os_open.side_effect = [100, 101]  # output_fd, input_fd
+        mock_select.return_value = ([100], [], [])
+
+        mock_out = Mock()
+        mock_fdopen.return_value = mock_out
+
+        matcher = PatternMatcher(mock_pdb_file)
+
+        # Setup mocks for match_batch
+        mock_os_write.return_value = len(b"line one\nline two\n")
+        mock_out.readline.side_effect = [b"out one\n", b"out two\n"]
+
+        results = matcher.match_batch(["line one", "line two"])
+
+        # All lines were written in a single payload
+        mock_os_write.assert_called_once_with(101, memoryview(b"line one\nline two\n"))
+
+        assert results == ["out one", "out two"]
+
+        with patch("os.close"), patch("shutil.rmtree"):
+            matcher.close()
+
+    @patch("os.read", side_effect=BlockingIOError)
+    @patch("select.select")
+    @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
+    @patch("os.write")
+    @patch("atexit.register")
+    @patch("time.sleep")
+    @patch("os.open")
+    @patch("subprocess.Popen")
+    @patch("os.mkfifo")
+    @patch("tempfile.mkdtemp")
+    def test_batch_output_closed_returns_originals(
+        self,
+        mock_mkdtemp,
+        mock_mkfifo,
+        mock_popen,
+        mock_os_open,
+        mock_sleep,
+        mock_atexit,
+        mock_os_write,
+        mock_fcntl,
+        mock_fdopen,
+        mock_file_open,
+        mock_select,
+        mock_os_read,
+        mock_pdb_file,
+    ):
+        """Test batch falls back to original lines when the output FIFO closes."""
+        mock_mkdtemp.return_value = "/tmp/test-dir"
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+        mock_popen.return_value = mock_process
+        mock_os_open.side_effect = [100, 101]
+        mock_select.return_value = ([100], [], [])
+
+        mock_out = Mock()
+        mock_fdopen.return_value = mock_out
+
+        matcher = PatternMatcher(mock_pdb_file)
+
+        mock_os_write.return_value = len(b"a\nb\n")
+        # First result arrives, then EOF (syslog-ng exited)
+        mock_out.readline.side_effect = [b"out a\n", b""]
+        mock_process.poll.return_value = 1
+
+        results = matcher.match_batch(["a", "b"])
+
+        # First line got its result; second fell back to the original
+        assert results == ["out a", "b"]
+
+        with patch("os.close"), patch("shutil.rmtree"):
+            matcher.close()
+
+    @patch("os.read", side_effect=BlockingIOError)
+    @patch("select.select")
+    @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
+    @patch("os.write")
+    @patch("atexit.register")
+    @patch("time.sleep")
+    @patch("os.open")
+    @patch("subprocess.Popen")
+    @patch("os.mkfifo")
+    @patch("tempfile.mkdtemp")
+    def test_batch_write_failure_returns_originals(
+        self,
+        mock_mkdtemp,
+        mock_mkfifo,
+        mock_popen,
+        mock_os_open,
+        mock_sleep,
+        mock_atexit,
+        mock_os_write,
+        mock_fcntl,
+        mock_fdopen,
+        mock_file_open,
+        mock_select,
+        mock_os_read,
+        mock_pdb_file,
+    ):
+        """Test batch falls back to originals when the payload write fails."""
+        mock_mkdtemp.return_value = "/tmp/test-dir"
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+        mock_popen.return_value = mock_process
+        mock_os_open.side_effect = [100, 101]
+        # No output ever becomes readable; the reader must notice the
+        # failed writer instead of blocking in readline() forever
+        mock_select.return_value = ([], [], [])
+
+        mock_out = Mock()
+        mock_fdopen.return_value = mock_out
+
+        matcher = PatternMatcher(mock_pdb_file)
+
+        mock_os_write.side_effect = OSError(22, "Invalid argument")
+
+        results = matcher.match_batch(["a", "b"])
+
+        assert results == ["a", "b"]
+        mock_out.readline.assert_not_called()
+
+        with patch("os.close"), patch("shutil.rmtree"):
+            matcher.close()
+
+    @patch("os.read", side_effect=BlockingIOError)
+    @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
+    @patch("atexit.register")
+    @patch("time.sleep")
+    @patch("os.open")
+    @patch("subprocess.Popen")
+    @patch("os.mkfifo")
+    @patch("tempfile.mkdtemp")
+    def test_empty_batch(
+        self,
+        mock_mkdtemp,
+        mock_mkfifo,
+        mock_popen,
+        mock_os_open,
+        mock_sleep,
+        mock_atexit,
+        mock_fcntl,
+        mock_fdopen,
+        mock_file_open,
+        mock_os_read,
+        mock_pdb_file,
+    ):
+        """Test matching an empty batch is a no-op."""
+        mock_mkdtemp.return_value = "/tmp/test-dir"
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+        mock_popen.return_value = mock_process
+        mock_os_open.side_effect = [100, 101]
+
+        mock_fdopen.return_value = Mock()
+
+        matcher = PatternMatcher(mock_pdb_file)
+
+        assert matcher.match_batch([]) == []
+
+        with patch("os.close"), patch("shutil.rmtree"):
+            matcher.close()
+
+
 @pytest.mark.unit
 class TestPatternMatcherClose:
     """Tests for PatternMatcher.close method."""
 
+    @patch("os.read", side_effect=BlockingIOError)
     @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
     @patch("os.path.exists", return_value=True)
     @patch("os.close")
     @patch("atexit.register")
@@ -314,7 +690,10 @@ class TestPatternMatcherClose:
         mock_atexit,
         mock_os_close,
         mock_exists,
+        mock_fcntl,
+        mock_fdopen,
         mock_file_open,
+        mock_os_read,
         mock_pdb_file,
     ):
         """Test normal close operation."""
@@ -326,6 +705,9 @@ class TestPatternMatcherClose:
         mock_popen.return_value = mock_process
         mock_os_open.side_effect = [100, 101]
 
+        mock_out = Mock()
+        mock_fdopen.return_value = mock_out
+
         matcher = PatternMatcher(mock_pdb_file)
 
         # Mock shutil.rmtree for close()
@@ -335,14 +717,18 @@ class TestPatternMatcherClose:
             # Verify temp directory was cleaned up
             mock_rmtree.assert_called_once_with("/tmp/test-dir", ignore_errors=True)
 
-        # Verify file descriptors were closed
-        assert mock_os_close.call_count == 2
+        # Verify the input fd and the buffered output reader were closed
+        mock_os_close.assert_called_once_with(101)
+        mock_out.close.assert_called_once()
 
         # Verify process was terminated
         mock_process.terminate.assert_called_once()
         mock_process.wait.assert_called_once_with(timeout=2)
 
+    @patch("os.read", side_effect=BlockingIOError)
     @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
     @patch("shutil.rmtree")
     @patch("os.close")
     @patch("atexit.register")
@@ -361,7 +747,10 @@ class TestPatternMatcherClose:
         mock_atexit,
         mock_os_close,
         mock_rmtree,
+        mock_fcntl,
+        mock_fdopen,
         mock_file_open,
+        mock_os_read,
         mock_pdb_file,
     ):
         """Test close handles file descriptor close errors."""
@@ -372,6 +761,8 @@ class TestPatternMatcherClose:
         mock_popen.return_value = mock_process
         mock_os_open.side_effect = [100, 101]
 
+        mock_fdopen.return_value = Mock()
+
         matcher = PatternMatcher(mock_pdb_file)
 
         # Simulate close error
@@ -383,7 +774,10 @@ class TestPatternMatcherClose:
         # Process should still be terminated
         mock_process.terminate.assert_called_once()
 
+    @patch("os.read", side_effect=BlockingIOError)
     @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
     @patch("shutil.rmtree")
     @patch("os.close")
     @patch("atexit.register")
@@ -402,7 +796,10 @@ class TestPatternMatcherClose:
         mock_atexit,
         mock_os_close,
         mock_rmtree,
+        mock_fcntl,
+        mock_fdopen,
         mock_file_open,
+        mock_os_read,
         mock_pdb_file,
     ):
         """Test close kills process if terminate times out."""
@@ -414,6 +811,8 @@ class TestPatternMatcherClose:
         mock_popen.return_value = mock_process
         mock_os_open.side_effect = [100, 101]
 
+        mock_fdopen.return_value = Mock()
+
         matcher = PatternMatcher(mock_pdb_file)
         matcher.close()
 
@@ -458,15 +857,15 @@ class TestMainFunction:
         # Setup matcher mock
         mock_matcher = Mock()
         mock_matcher.match.side_effect = lambda line: f"[normalized:{line}]"
-        mock_matcher_class.return_value = mock_matcher
+        mock_matcher_class.get_or_create.return_value = mock_matcher
 
         # Patch __file__ to point to tmp_path
         with patch("patterndb_yaml.pattern_filter.__file__", str(tmp_path / "pattern_filter.py")):
             # Run main
             main()
 
-        # Verify matcher was created with the patterns.xml path
-        mock_matcher_class.assert_called_once_with(patterns_xml)
+        # Verify matcher was obtained for the patterns.xml path
+        mock_matcher_class.get_or_create.assert_called_once_with(patterns_xml)
 
         # Verify lines were matched
         assert mock_matcher.match.call_count == 3
@@ -474,16 +873,17 @@ class TestMainFunction:
         mock_matcher.match.assert_any_call("line 2")
         mock_matcher.match.assert_any_call("line 3")
 
-        # Verify matcher was closed
-        mock_matcher.close.assert_called_once()
+        # Matcher stays open for reuse; the atexit hook owns its shutdown
+        mock_matcher.close.assert_not_called()
 
         # Verify output
         print_calls = [str(call) for call in mock_print.call_args_list]
         assert any("[normalized:line 1]" in str(call) for call in print_calls)
 
+    @patch("sys.stdout")
     @patch("pathlib.Path.exists", return_value=True)
     @patch("patterndb_yaml.pattern_filter.PatternMatcher")
-    def test_main_handles_keyboard_interrupt(self, mock_matcher_class, mock_exists):
+    def test_main_handles_keyboard_interrupt(self, mock_matcher_class, mock_exists, mock_stdout):
         """Test main() handles KeyboardInterrupt gracefully."""
         mock_matcher = Mock()
         # First call succeeds, second raises KeyboardInterrupt
@@ -491,7 +891,7 @@ class TestMainFunction:
             "[normalized:line 1]",
             KeyboardInterrupt(),
         ]
-        mock_matcher_class.return_value = mock_matcher
+        mock_matcher_class.get_or_create.return_value = mock_matcher
 
         # Mock stdin to provide two lines
         with patch("sys.stdin", new_callable=StringIO) as mock_stdin:
@@ -501,16 +901,20 @@ class TestMainFunction:
             # Should not raise - KeyboardInterrupt handled gracefully
             main()
 
-        # Matcher should be closed even after KeyboardInterrupt
-        mock_matcher.close.assert_called_once()
+        # The already-matched line is flushed, so only the in-flight one is lost
+        mock_stdout.write.assert_called_once_with("[normalized:line 1]\n")
+        mock_stdout.flush.assert_called_once()
+
+        # Matcher stays open even after KeyboardInterrupt (atexit closes it)
+        mock_matcher.close.assert_not_called()
 
-    @patch("builtins.print", side_effect=[None, BrokenPipeError()])
+    @patch("sys.stdout.write", side_effect=BrokenPipeError())
     @patch("patterndb_yaml.pattern_filter.PatternMatcher")
     @patch("sys.stdin", new_callable=StringIO)
     @patch("sys.stderr.close")
     @patch("pathlib.Path.exists", return_value=True)
     def test_main_handles_broken_pipe(
-        self, mock_exists, mock_stderr_close, mock_stdin, mock_matcher_class, mock_print
+        self, mock_exists, mock_stderr_close, mock_stdin, mock_matcher_class, mock_stdout_write
     ):
         """Test main() handles BrokenPipeError gracefully."""
         mock_stdin.write("line 1\nline 2\n")
@@ -518,7 +922,7 @@ class TestMainFunction:
 
         mock_matcher = Mock()
         mock_matcher.match.return_value = "output"
-        mock_matcher_class.return_value = mock_matcher
+        mock_matcher_class.get_or_create.return_value = mock_matcher
 
         # Should not raise
         main()
@@ -526,6 +930,27 @@ class TestMainFunction:
         # stderr.close should be called
         mock_stderr_close.assert_called_once()
 
+    @patch("sys.stdout")
+    @patch("patterndb_yaml.pattern_filter.PatternMatcher")
+    @patch("sys.stdin", new_callable=StringIO)
+    @patch("pathlib.Path.exists", return_value=True)
+    def test_main_flushes_remaining_output(
+        self, mock_exists, mock_stdin, mock_matcher_class, mock_stdout
+    ):
+        """Test main() flushes buffered output once stdin is drained."""
+        mock_stdin.write("line 1\nline 2\n")
+        mock_stdin.seek(0)
+
+        mock_matcher = Mock()
+        mock_matcher.match.side_effect = lambda line: f"[normalized:{line}]"
+        mock_matcher_class.get_or_create.return_value = mock_matcher
+
+        main()
+
+        # Both results arrive in a single coalesced write
+        mock_stdout.write.assert_called_once_with("[normalized:line 1]\n[normalized:line 2]\n")
+        mock_stdout.flush.assert_called_once()
+
     @patch("builtins.print")
     @patch("pathlib.Path.exists", return_value=False)
     def test_main_missing_patterns_xml(self, mock_exists, mock_print):
@@ -540,3 +965,168 @@ class TestMainFunction:
         # Should print error message
         error_calls = [call for call in mock_print.call_args_list if "Error:" in str(call)]
         assert len(error_calls) > 0
+
+
+@pytest.mark.unit
+class TestPatternMatcherPool:
+    """Tests for PatternMatcherPool."""
+
+    @patch("patterndb_yaml.pattern_filter.PatternMatcher")
+    def test_pool_creates_workers(self, mock_matcher_class, mock_pdb_file):
+        """Test the pool spawns one matcher per worker."""
+        pool = PatternMatcherPool(mock_pdb_file, n_workers=3)
+
+        assert pool.n_workers == 3
+        assert mock_matcher_class.call_count == 3
+
+        pool.close()
+
+    @patch("patterndb_yaml.pattern_filter.PatternMatcher")
+    def test_small_batch_uses_single_worker(self, mock_matcher_class, mock_pdb_file):
+        """Test tiny batches skip fan-out and use the first worker."""
+        mock_matcher_class.side_effect = lambda _: Mock(
+            match_batch=Mock(side_effect=lambda lines: [f"[{line}]" for line in lines])
+        )
+        pool = PatternMatcherPool(mock_pdb_file, n_workers=4)
+
+        results = pool.match_batch(["a", "b"])
+
+        assert results == ["[a]", "[b]"]
+        pool.matchers[0].match_batch.assert_called_once_with(["a", "b"])
+        for matcher in pool.matchers[1:]:
+            matcher.match_batch.assert_not_called()
+
+        pool.close()
+
+    @patch("patterndb_yaml.pattern_filter.PatternMatcher")
+    def test_large_batch_preserves_order(self, mock_matcher_class, mock_pdb_file):
+        """Test fan-out across workers keeps results in input order."""
+        mock_matcher_class.side_effect = lambda _: Mock(
+            match_batch=Mock(side_effect=lambda lines: [f"[{line}]" for line in lines])
+        )
+        pool = PatternMatcherPool(mock_pdb_file, n_workers=2)
+
+        lines = [f"line {i}" for i in range(10)]
+        results = pool.match_batch(lines)
+
+        assert results == [f"[line {i}]" for i in range(10)]
+        # Both workers received a chunk
+        for matcher in pool.matchers:
+            matcher.match_batch.assert_called_once()
+
+        pool.close()
+
+    @patch("patterndb_yaml.pattern_filter.PatternMatcher")
+    def test_match_delegates_to_first_worker(self, mock_matcher_class, mock_pdb_file):
+        """Test single-line match goes to the first worker."""
+        mock_matcher_class.side_effect = lambda _: Mock(match=Mock(return_value="[out]"))
+        pool = PatternMatcherPool(mock_pdb_file, n_workers=2)
+
+        assert pool.match("in") == "[out]"
+        pool.matchers[0].match.assert_called_once_with("in")
+
+        pool.close()
+
+    @patch("patterndb_yaml.pattern_filter.PatternMatcher")
+    def test_close_closes_all_workers(self, mock_matcher_class, mock_pdb_file):
+        """Test close shuts down every worker."""
+        mock_matcher_class.side_effect = lambda _: Mock()
+        pool = PatternMatcherPool(mock_pdb_file, n_workers=2)
+
+        pool.close()
+
+        for matcher in pool.matchers:
+            matcher.close.assert_called_once()
+
+
+@pytest.mark.unit
+class TestGetOrCreate:
+    """Tests for PatternMatcher.get_or_create caching."""
+
+    @pytest.fixture(autouse=True)
+    def clear_matcher_cache(self):
+        """Keep the module-level matcher cache isolated between tests."""
+        pattern_filter._matcher_cache.clear()
+        yield
+        pattern_filter._matcher_cache.clear()
+
+    @patch("os.read", side_effect=BlockingIOError)
+    @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
+    @patch("atexit.register")
+    @patch("time.sleep")
+    @patch("os.open")
+    @patch("subprocess.Popen")
+    @patch("os.mkfifo")
+    @patch("tempfile.mkdtemp")
+    def test_live_matcher_is_reused(
+        self,
+        mock_mkdtemp,
+        mock_mkfifo,
+        mock_popen,
+        mock_os_open,
+        mock_sleep,
+        mock_atexit,
+        mock_fcntl,
+        mock_fdopen,
+        mock_file_open,
+        mock_os_read,
+        mock_pdb_file,
+    ):
+        """Test a second call returns the cached matcher without re-setup."""
+        mock_mkdtemp.return_value = "/tmp/test-dir"
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+        mock_popen.return_value = mock_process
+        mock_os_open.side_effect = [100, 101]
+        mock_fdopen.return_value = Mock()
+
+        first = PatternMatcher.get_or_create(mock_pdb_file)
+        second = PatternMatcher.get_or_create(mock_pdb_file)
+
+        assert first is second
+        mock_popen.assert_called_once()
+
+    @patch("os.read", side_effect=BlockingIOError)
+    @patch("builtins.open", create=True)
+    @patch("os.fdopen")
+    @patch("fcntl.fcntl")
+    @patch("atexit.register")
+    @patch("time.sleep")
+    @patch("os.open")
+    @patch("subprocess.Popen")
+    @patch("os.mkfifo")
+    @patch("tempfile.mkdtemp")
+    def test_dead_matcher_is_replaced(
+        self,
+        mock_mkdtemp,
+        mock_mkfifo,
+        mock_popen,
+        mock_os_open,
+        mock_sleep,
+        mock_atexit,
+        mock_fcntl,
+        mock_fdopen,
+        mock_file_open,
+        mock_os_read,
+        mock_pdb_file,
+    ):
+        """Test a matcher whose process exited is not reused."""
+        mock_mkdtemp.return_value = "/tmp/test-dir"
+        mock_process = Mock()
+        mock_process.poll.return_value = None
+        mock_popen.return_value = mock_process
+        mock_os_open.side_effect = [100, 101, 100, 101]
+        mock_fdopen.return_value = Mock()
+
+        first = PatternMatcher.get_or_create(mock_pdb_file)
+
+        # Simulate the syslog-ng process exiting
+        mock_process.poll.return_value = 1
+        mock_process.poll.side_effect = [1, None, None]
+
+        second = PatternMatcher.get_or_create(mock_pdb_file)
+
+        assert first is not second
+        assert pattern_filter._matcher_cache[mock_pdb_file] is second
@@ -0,0 +1,99 @@
+"""Tests for pattern_matching module."""
+
+import pytest
+
+from patterndb_yaml.pattern_matching import (
+    RENDERED_ALTERNATIVES_KEY,
+    match_pattern_components,
+    render_component_sequence,
+)
+
+
+@pytest.mark.unit
+class TestMatchPatternComponents:
+    """Tests for match_pattern_components."""
+
+    def test_text_component_matches(self):
+        """Test exact text component matching."""
+        matched, fields = match_pattern_components("hello world", [{"text": "hello world"}])
+
+        assert matched
+        assert fields == {}
+
+    def test_text_component_mismatch(self):
+        """Test text component failing to match."""
+        matched, _ = match_pattern_components("goodbye", [{"text": "hello"}])
+
+        assert not matched
+
+    def test_field_extraction(self):
+        """Test ANYSTRING field extraction to end of line."""
+        pattern = [{"text": "user: "}, {"field": "name"}]
+        matched, fields = match_pattern_components("user: alice", pattern, extract_fields=True)
+
+        assert matched
+        assert fields == {"name": "alice"}
+
+    def test_number_field(self):
+        """Test NUMBER parser extracts digits only."""
+        pattern = [{"text": "code "}, {"field": "code", "parser": "NUMBER"}]
+        matched, fields = match_pattern_components("code 404", pattern, extract_fields=True)
+
+        assert matched
+        assert fields == {"code": "404"}
+
+    def test_number_field_mismatch(self):
+        """Test NUMBER parser fails on non-digits."""
+        pattern = [{"field": "code", "parser": "NUMBER"}]
+        matched, _ = match_pattern_components("abc", pattern)
+
+        assert not matched
+
+    def test_ansi_codes_stripped(self):
+        """Test ANSI escape codes are stripped before matching."""
+        matched, _ = match_pattern_components("\x1b[1mhello\x1b[0m", [{"text": "hello"}])
+
+        assert matched
+
+    def test_alternatives_match(self):
+        """Test alternatives component matches any alternative."""
+        component = {"alternatives": [[{"text": "yes"}], [{"text": "no"}]]}
+        matched, _ = match_pattern_components("no", [component])
+
+        assert matched
+
+    def test_alternatives_rendered_once(self):
+        """Test rendered alternative text is memoized on the component."""
+        component = {"alternatives": [[{"text": "yes"}], [{"text": "no"}]]}
+
+        match_pattern_components("yes", [component])
+
+        assert component[RENDERED_ALTERNATIVES_KEY] == ["yes", "no"]
+
+        # Second match reuses the memoized rendering
+        matched, _ = match_pattern_components("no", [component])
+        assert matched
+
+    def test_alternatives_no_match(self):
+        """Test alternatives component failing to match."""
+        component = {"alternatives": [[{"text": "yes"}], [{"text": "no"}]]}
+        matched, _ = match_pattern_components("maybe", [component])
+
+        assert not matched
+
+
+@pytest.mark.unit
+class TestRenderComponentSequence:
+    """Tests for render_component_sequence."""
+
+    def test_renders_text_and_serialized(self):
+        """Test text and serialized components concatenate."""
+        components = [{"text": "a"}, {"serialized": "-"}, {"text": "b"}]
+
+        assert render_component_sequence(components) == "a-b"
+
+    def test_skips_unsupported_components(self):
+        """Test fields are skipped in literal rendering."""
+        components = [{"text": "a"}, {"field": "x"}]
+
+        assert render_component_sequence(components) == "a"
@@ -1,6 +1,5 @@
 """Advanced tests for patterndb_yaml module - edge cases and sequences."""
 
-import tempfile
 from io import StringIO
 from pathlib import Path
 
@@ -12,7 +11,10 @@ from patterndb_yaml.pattern_matching import (
     match_pattern_components,
     render_component_sequence,
 )
-from patterndb_yaml.patterndb_yaml import _load_sequence_config
+from patterndb_yaml.patterndb_yaml import (
+    _load_sequence_config_from_path,
+    _NormalizeCache,
+)
 
 
 @pytest.mark.unit
@@ -167,83 +169,65 @@ class TestRenderComponentSequence:
 
 @pytest.mark.unit
 class TestLoadSequenceConfig:
-    """Tests for _load_sequence_config function."""
+    """Tests for _load_sequence_config_from_path function."""
 
-    def test_load_no_sequences(self):
+    def test_load_no_sequences(self, tmp_path):
         """Test loading config with no sequences."""
         rules = {"rules": [{"name": "simple_rule", "pattern": [], "output": "simple"}]}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
-
-        try:
-            configs, markers = _load_sequence_config(rules_path)
-            assert configs == {}
-            assert markers == set()
-        finally:
-            rules_path.unlink()
-
-    def test_load_sequence_with_field_placeholder(self):
-        """Test loading sequence with field placeholder in output."""
-        rules = {
-            "rules": [
-                {
-                    "name": "dialog_question",
-                    "pattern": [],
-                    "output": "[dialog-question:{content}]",
-                    "sequence": {"followers": []},
-                }
-            ]
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            configs, markers = _load_sequence_config(rules_path)
-            assert "dialog_question" in configs
-            assert "[dialog-question:" in markers
-        finally:
-            rules_path.unlink()
-
-    def test_load_sequence_without_field_placeholder(self):
-        """Test loading sequence without field placeholder."""
+        configs, markers, marker_to_rule = _load_sequence_config_from_path(rules_path)
+        assert configs == {}
+        assert markers == set()
+        assert marker_to_rule == {}
+
+    @pytest.mark.parametrize(
+        ("rule_name", "output", "expected_marker"),
+        [
+            ("dialog_question", "[dialog-question:{content}]", "[dialog-question:"),
+            ("simple_sequence", "[simple-output]", "[simple-output]"),
+        ],
+        ids=["with_field_placeholder", "without_field_placeholder"],
+    )
+    def test_load_sequence_marker_extraction(self, tmp_path, rule_name, output, expected_marker):
+        """Test the leader marker extracted from outputs with and without fields."""
         rules = {
             "rules": [
                 {
-                    "name": "simple_sequence",
+                    "name": rule_name,
                     "pattern": [],
-                    "output": "[simple-output]",
+                    "output": output,
                     "sequence": {"followers": []},
                 }
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            configs, markers = _load_sequence_config(rules_path)
-            assert "simple_sequence" in configs
-            assert "[simple-output]" in markers
-        finally:
-            rules_path.unlink()
+        configs, markers, marker_to_rule = _load_sequence_config_from_path(rules_path)
+        assert rule_name in configs
+        assert expected_marker in markers
+        assert marker_to_rule[expected_marker] == rule_name
 
     def test_load_nonexistent_file(self):
         """Test loading from nonexistent file."""
-        configs, markers = _load_sequence_config(Path("/nonexistent/file.yaml"))
+        configs, markers, marker_to_rule = _load_sequence_config_from_path(
+            Path("/nonexistent/file.yaml")
+        )
         assert configs == {}
         assert markers == set()
+        assert marker_to_rule == {}
 
 
 @pytest.mark.integration
+@pytest.mark.needs_syslogng
 class TestSequenceProcessing:
     """Tests for sequence processing functionality."""
 
-    def test_sequence_with_followers(self):
+    def test_sequence_with_followers(self, tmp_path):
         """Test processing multi-line sequences."""
         rules = {
             "rules": [
@@ -269,35 +253,31 @@ class TestSequenceProcessing:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
+        processor = PatterndbYaml(rules_path=rules_path)
 
-            # Process question and answer sequence
-            logs = ["Q: What is the answer?", "A: 42", "Q: Another question?"]
+        # Process question and answer sequence
+        logs = ["Q: What is the answer?", "A: 42", "Q: Another question?"]
 
-            input_data = StringIO("\n".join(logs))
-            output_data = StringIO()
-            processor.process(input_data, output_data)
+        input_data = StringIO("\n".join(logs))
+        output_data = StringIO()
+        processor.process(input_data, output_data)
 
-            # Flush any buffered sequence
-            processor.flush(output_data)
+        # Flush any buffered sequence
+        processor.flush(output_data)
 
-            output_data.seek(0)
-            result = output_data.read()
+        output_data.seek(0)
+        result = output_data.read()
 
-            # Check that sequences were processed
-            assert "[Q:What is the answer?]" in result
-            assert "[A:42]" in result
+        # Check that sequences were processed
+        assert "[Q:What is the answer?]" in result
+        assert "[A:42]" in result
 
-            processor.seq_processor.sequence_buffer = []
-        finally:
-            rules_path.unlink()
+        processor.seq_processor.sequence_buffer = []
 
-    def test_follower_with_no_output_template(self):
+    def test_follower_with_no_output_template(self, tmp_path):
         """Test follower with no output template."""
         rules = {
             "rules": [
@@ -317,23 +297,19 @@ class TestSequenceProcessing:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
+        processor = PatterndbYaml(rules_path=rules_path)
 
-            # The follower should return raw line when no template
-            raw_line = "FOLLOW"
-            result = processor.seq_processor.normalize_follower(raw_line, "leader")
+        # The follower should return raw line when no template
+        raw_line = "FOLLOW"
+        result = processor.seq_processor.normalize_follower(raw_line, "leader")
 
-            # Should return raw line since no output template
-            assert result == "FOLLOW"
-        finally:
-            rules_path.unlink()
+        # Should return raw line since no output template
+        assert result == "FOLLOW"
 
-    def test_follower_template_missing_field(self):
+    def test_follower_template_missing_field(self, tmp_path):
         """Test follower template with missing field."""
         rules = {
             "rules": [
@@ -356,128 +332,158 @@ class TestSequenceProcessing:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
+        processor = PatterndbYaml(rules_path=rules_path)
 
-            # The follower template references missing_field which won't be extracted
-            raw_line = "DATA: test_value"
-            result = processor.seq_processor.normalize_follower(raw_line, "leader")
+        # The follower template references missing_field which won't be extracted
+        raw_line = "DATA: test_value"
+        result = processor.seq_processor.normalize_follower(raw_line, "leader")
 
-            # Should return raw line due to KeyError
-            assert result == "DATA: test_value"
-        finally:
-            rules_path.unlink()
+        # Should return raw line due to KeyError
+        assert result == "DATA: test_value"
 
-    def test_follower_unknown_rule(self):
+    def test_follower_unknown_rule(self, tmp_path):
         """Test normalize_follower with unknown rule."""
         rules = {"rules": []}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
+        processor = PatterndbYaml(rules_path=rules_path)
 
-            result = processor.seq_processor.normalize_follower("test", "nonexistent_rule")
-            assert result == "test"
-        finally:
-            rules_path.unlink()
+        result = processor.seq_processor.normalize_follower("test", "nonexistent_rule")
+        assert result == "test"
 
-    def test_is_sequence_follower_unknown_rule(self):
+    def test_is_sequence_follower_unknown_rule(self, tmp_path):
         """Test is_sequence_follower with unknown rule."""
         rules = {"rules": []}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
+        processor = PatterndbYaml(rules_path=rules_path)
 
-            result = processor.seq_processor.is_sequence_follower("test", "nonexistent_rule")
-            assert result is False
-        finally:
-            rules_path.unlink()
+        result = processor.seq_processor.is_sequence_follower("test", "nonexistent_rule")
+        assert result is False
 
 
 @pytest.mark.unit
+@pytest.mark.needs_syslogng
 class TestPatterndbYamlEdgeCases:
     """Edge case tests for PatterndbYaml."""
 
-    def test_get_stats_no_processing(self):
+    def test_get_stats_no_processing(self, tmp_path):
         """Test get_stats before any processing."""
         rules = {"rules": []}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            stats = processor.get_stats()
+        processor = PatterndbYaml(rules_path=rules_path)
+        stats = processor.get_stats()
 
-            assert stats["lines_processed"] == 0
-            assert stats["lines_matched"] == 0
-            assert stats["match_rate"] == 0.0
-        finally:
-            rules_path.unlink()
+        assert stats["lines_processed"] == 0
+        assert stats["lines_matched"] == 0
+        assert stats["match_rate"] == 0.0
 
-    def test_flush_empty_buffer(self):
+    def test_flush_empty_buffer(self, tmp_path):
         """Test flush with empty sequence buffer."""
         rules = {"rules": []}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            processor = PatterndbYaml(rules_path=rules_path)
-            output = StringIO()
+        processor = PatterndbYaml(rules_path=rules_path)
+        output = StringIO()
 
-            # Flush with no buffered data - should not raise
-            processor.flush(output)
+        # Flush with no buffered data - should not raise
+        processor.flush(output)
 
-            assert output.getvalue() == ""
-        finally:
-            rules_path.unlink()
+        assert output.getvalue() == ""
 
-    def test_print_explain_outputs_to_stderr(self, capsys):
+    def test_print_explain_outputs_to_stderr(self, capsys, tmp_path):
         """Test that _print_explain method outputs to stderr when explain=True."""
         rules = {"rules": []}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
 
-        try:
-            # Test with explain=True
-            processor = PatterndbYaml(rules_path=rules_path, explain=True)
-            processor._print_explain("Test explanation message")
+        # Test with explain=True
+        processor = PatterndbYaml(rules_path=rules_path, explain=True)
+        processor._print_explain("Test explanation message")
 
-            captured = capsys.readouterr()
-            assert "EXPLAIN: Test explanation message" in captured.err
-        finally:
-            rules_path.unlink()
+        captured = capsys.readouterr()
+        assert "EXPLAIN: Test explanation message" in captured.err
 
-    def test_print_explain_silent_when_disabled(self, capsys):
+    def test_print_explain_silent_when_disabled(self, capsys, tmp_path):
         """Test that _print_explain method is silent when explain=False."""
         rules = {"rules": []}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(rules, f)
-            rules_path = Path(f.name)
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(yaml.dump(rules))
+
+        # Test with explain=False (default)
+        processor = PatterndbYaml(rules_path=rules_path, explain=False)
+        processor._print_explain("Test explanation message")
+
+        captured = capsys.readouterr()
+        assert captured.err == ""
+
+
+@pytest.mark.unit
+class TestNormalizeCache:
+    """Tests for the _NormalizeCache memo used by the processor."""
+
+    def test_call_caches_results(self):
+        """Test repeated calls hit the cache instead of re-normalizing."""
+        calls = []
+
+        def normalize(line):
+            calls.append(line)
+            return f"[norm:{line}]"
+
+        cache = _NormalizeCache(normalize)
+
+        assert cache("a") == "[norm:a]"
+        assert cache("a") == "[norm:a]"
+        assert calls == ["a"]
+
+        info = cache.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        assert info.currsize == 1
+
+    def test_bulk_eviction(self):
+        """Test the cache is cleared once it reaches its size bound."""
+        cache = _NormalizeCache(lambda s: s.upper(), maxsize=2)
+
+        cache("a")
+        cache("b")
+        cache("c")  # Triggers bulk eviction before insert
+
+        assert cache.cache_info().currsize == 1
+
+    def test_normalize_batch_sends_only_misses(self):
+        """Test batch normalization only sends uncached lines to the matcher."""
+        cache = _NormalizeCache(lambda s: f"[norm:{s}]")
+        cache("a")  # Pre-populate
+
+        batches = []
+
+        def normalize_batch(lines):
+            batches.append(lines)
+            return [f"[norm:{line}]" for line in lines]
+
+        results = cache.normalize_batch(["a", "b", "b", "a"], normalize_batch)
 
-        try:
-            # Test with explain=False (default)
-            processor = PatterndbYaml(rules_path=rules_path, explain=False)
-            processor._print_explain("Test explanation message")
+        assert results == ["[norm:a]", "[norm:b]", "[norm:b]", "[norm:a]"]
+        # Only the one uncached unique line reached the matcher
+        assert batches == [["b"]]
 
-            captured = capsys.readouterr()
-            assert captured.err == ""
-        finally:
-            rules_path.unlink()
+        info = cache.cache_info()
+        # "a" hit 3 times (once via __call__ miss): batch saw hits for
+        # cached "a" twice and duplicate "b" once, one miss for "b"
+        assert info.hits == 3
+        assert info.misses == 2
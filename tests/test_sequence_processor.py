@@ -0,0 +1,98 @@
+"""Tests for sequence_processor module."""
+
+import io
+
+import pytest
+
+from patterndb_yaml.sequence_processor import SequenceProcessor
+
+
+@pytest.fixture
+def dialog_configs():
+    """Sequence configurations with a single dialog rule."""
+    return {
+        "dialog_question": {
+            "name": "dialog_question",
+            "output": "[dialog-question:{content}]",
+            "sequence": {
+                "followers": [
+                    {
+                        "pattern": [{"text": "> "}, {"field": "option"}],
+                        "output": "[dialog-option:{option}]",
+                    }
+                ]
+            },
+        }
+    }
+
+
+@pytest.fixture
+def dialog_markers():
+    """Markers matching the dialog rule output."""
+    return {"[dialog-question:"}
+
+
+@pytest.mark.unit
+class TestIsSequenceLeader:
+    """Tests for SequenceProcessor.is_sequence_leader."""
+
+    def test_leader_detected(self, dialog_configs, dialog_markers):
+        """Test a normalized line starting with a marker is a leader."""
+        processor = SequenceProcessor(dialog_configs, dialog_markers)
+
+        assert processor.is_sequence_leader("[dialog-question:Continue?]") == "dialog_question"
+
+    def test_non_leader_returns_none(self, dialog_configs, dialog_markers):
+        """Test a line without any marker is not a leader."""
+        processor = SequenceProcessor(dialog_configs, dialog_markers)
+
+        assert processor.is_sequence_leader("[other-rule:value]") is None
+
+    def test_marker_must_be_prefix(self, dialog_configs, dialog_markers):
+        """Test a marker appearing mid-line does not make a leader."""
+        processor = SequenceProcessor(dialog_configs, dialog_markers)
+
+        assert processor.is_sequence_leader("prefix [dialog-question:x]") is None
+
+    def test_no_markers_configured(self):
+        """Test leader detection with no sequences configured."""
+        processor = SequenceProcessor({}, set())
+
+        assert processor.is_sequence_leader("[dialog-question:x]") is None
+
+    def test_overlapping_markers_prefer_longest(self):
+        """Test the longest matching marker wins for overlapping markers."""
+        configs = {
+            "short": {"name": "short", "output": "[dialog:{content}]", "sequence": {}},
+            "long": {"name": "long", "output": "[dialog-question:{content}]", "sequence": {}},
+        }
+        markers = {"[dialog:", "[dialog-question:"}
+        processor = SequenceProcessor(configs, markers)
+
+        assert processor.is_sequence_leader("[dialog-question:x]") == "long"
+
+
+@pytest.mark.unit
+class TestProcessLineFastPath:
+    """Tests for the no-sequences process_line fast path."""
+
+    def test_fast_path_installed_without_markers(self):
+        """Test the write-only process_line is used when no sequences exist."""
+        processor = SequenceProcessor({}, set())
+
+        assert processor.process_line.__func__ is SequenceProcessor._process_line_no_sequences
+
+    def test_fast_path_writes_normalized_line(self):
+        """Test the fast path writes the normalized line directly."""
+        processor = SequenceProcessor({}, set())
+        output = io.StringIO()
+
+        processor.process_line("raw line", "[normalized]", output)
+
+        assert output.getvalue() == "[normalized]\n"
+
+    def test_full_path_kept_with_markers(self, dialog_configs, dialog_markers):
+        """Test the sequence-aware process_line is kept when markers exist."""
+        processor = SequenceProcessor(dialog_configs, dialog_markers)
+
+        assert processor.process_line.__func__ is SequenceProcessor.process_line